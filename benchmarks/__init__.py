@@ -0,0 +1,7 @@
+'''
+=== PRUEBAS DE RENDIMIENTO ===
+
+Módulos:
+- sinteticos -> genera archivos .LIS, ESTACIONES.txt y NBMI.txt sintéticos.
+- medir -> mide cada etapa del programa y la compara con una línea base.
+'''
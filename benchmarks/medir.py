@@ -0,0 +1,230 @@
+'''
+=== PRUEBAS DE RENDIMIENTO DEL PROGRAMA DE TABLAS DE MAREA ===
+
+Genera datos sintéticos (ver "sinteticos.py") para N estaciones x M años y mide
+por separado cada etapa del programa:
+- estaciones -> lectura de "ESTACIONES.txt" y "NBMI.txt" (sin usar el caché).
+- lectura -> lectura del texto de todos los archivos .LIS.
+- cache -> lectura de los mismos archivos desde su caché binario (.npy).
+- maquetado -> acomodo de los datos de cada mes en su tabla.
+- texto -> texto de ancho fijo de cada mes.
+- pdf -> dibujo del PDF de cada estación (solo si fpdf está instalado).
+
+De cada etapa se reporta el tiempo (el menor de varias repeticiones), la
+memoria máxima (con "tracemalloc", en una ejecución aparte) y el número de
+tablas mensuales por segundo.
+
+Con "--guardar" los resultados se guardan como línea base; con "--comparar"
+el programa termina con error si alguna etapa tarda o usa más memoria que la
+línea base, más la tolerancia indicada. La línea base depende del equipo, por
+lo que no forma parte del repositorio: se guarda en cada equipo junto con su
+nombre, procesador, número de núcleos y versión de Python, y "--comparar" se
+niega a usar una línea base obtenida en otro equipo.
+
+Uso:
+~~~
+python -m benchmarks.medir --guardar
+python -m benchmarks.medir --comparar
+~~~
+'''
+
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.cache_lis import cargar_lis
+from tablasmarea.estaciones import construir_registro
+from tablasmarea.generador import TablasEstacion, preparar_datos
+from tablasmarea.lis import leer_lis
+from tablasmarea.maquetado import maquetar_mes
+from tablasmarea.texto import texto_mes
+
+
+# Archivo con la línea base, junto a este módulo.
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+
+# --- FUNCIÓN PARA DESCRIBIR EL EQUIPO DONDE SE MIDE ---
+# Regresa un diccionario con el nombre del equipo, el procesador, el número de núcleos y la versión de Python.
+def describir_equipo():
+    return {"nombre": platform.node(), "procesador": platform.processor() or platform.machine(),
+            "nucleos": os.cpu_count(), "python": platform.python_version()}
+
+
+# --- FUNCIÓN PARA MEDIR EL TIEMPO Y LA MEMORIA DE UNA ETAPA ---
+# Recibe dos parámetros:
+# 1. etapa -> función sin parámetros que ejecuta la etapa.
+# 2. repeticiones -> número de veces que se mide el tiempo.
+# Regresa el menor tiempo en segundos y la memoria máxima en KiB.
+def medir(etapa, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        etapa()
+        tiempos.append(time.perf_counter() - inicio)
+
+    # La memoria se mide en otra ejecución, porque "tracemalloc" hace más lenta la etapa.
+    tracemalloc.start()
+    try:
+        etapa()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(tiempos), pico / 1024
+
+
+# --- FUNCIÓN PARA EJECUTAR LAS PRUEBAS DE RENDIMIENTO ---
+# Recibe cinco parámetros:
+# 1. directorio -> carpeta donde se generan los datos sintéticos.
+# 2. estaciones -> número de estaciones.
+# 3. years -> número de años de cada estación.
+# 4. repeticiones -> número de veces que se mide el tiempo de cada etapa.
+# 5. seleccion -> nombres de las etapas que se miden (None para medirlas todas).
+# Regresa un diccionario con la configuración y los resultados de cada etapa.
+def ejecutar(directorio, estaciones = 20, years = 2, repeticiones = 5, seleccion = None):
+    archivos = generar_datos(directorio, estaciones, years)
+    inicio, fin = (2024, 1), (2024 + years - 1, 12)
+
+    # Se preparan una vez los datos de cada etapa, para medir cada una por separado...
+    # (esto también crea el caché binario de los archivos .LIS).
+    registro = construir_registro(directorio)
+    datos = [preparar_datos(archivo, 2024, registro, directorio, inicio, fin) for archivo in archivos]
+    tablas = [{(year, mes): maquetar_mes(d.fecha[i0:i1], d.tiempos[i0:i1], d.alturas[i0:i1], mes, year)
+               for year, mes, i0, i1 in d.meses} for d in datos]
+    totalTablas = sum(len(tablasEstacion) for tablasEstacion in tablas)
+
+    def etapa_estaciones():
+        construir_registro(directorio)
+
+    def etapa_lectura():
+        for archivo in archivos:
+            leer_lis(archivo)
+
+    def etapa_cache():
+        for archivo in archivos:
+            cargar_lis(archivo)
+
+    def etapa_maquetado():
+        for d in datos:
+            for year, mes, i0, i1 in d.meses:
+                maquetar_mes(d.fecha[i0:i1], d.tiempos[i0:i1], d.alturas[i0:i1], mes, year)
+
+    def etapa_texto():
+        for d, tablasEstacion in zip(datos, tablas):
+            for (year, mes), tabla in tablasEstacion.items():
+                texto_mes(tabla, d.estacion.nombre, d.estacion.meridiano, mes, year)
+
+    etapas = {"estaciones": etapa_estaciones, "lectura": etapa_lectura, "cache": etapa_cache,
+              "maquetado": etapa_maquetado, "texto": etapa_texto}
+
+    try:
+        from tablasmarea.pdf import pdf_estacion
+    except ImportError:
+        pdf_estacion = None
+    if pdf_estacion is not None:
+        logo = os.path.join(directorio, "unam_logo.png")
+
+        def etapa_pdf():
+            for d, tablasEstacion in zip(datos, tablas):
+                pdf_estacion(TablasEstacion(d.estacion, d.year, tablasEstacion, None, None), logo)
+
+        etapas["pdf"] = etapa_pdf
+
+    resultados = {}
+    for nombre, etapa in etapas.items():
+        if seleccion is not None and nombre not in seleccion:
+            continue
+        segundos, picoKiB = medir(etapa, repeticiones)
+        resultados[nombre] = {"segundos": round(segundos, 6), "pico_kib": round(picoKiB, 1),
+                              "tablas_por_segundo": round(totalTablas / segundos, 1)}
+
+    return {"configuracion": {"estaciones": estaciones, "years": years, "tablas": totalTablas,
+                              "equipo": describir_equipo()},
+            "etapas": resultados}
+
+
+# --- FUNCIÓN PARA COMPARAR LOS RESULTADOS CON LA LÍNEA BASE ---
+# Recibe tres parámetros:
+# 1. resultados -> diccionario que regresa "ejecutar".
+# 2. base -> diccionario guardado como línea base.
+# 3. tolerancia -> aumento permitido, como fracción (0.5 permite hasta 50 % más de tiempo o memoria).
+# Regresa la lista de mensajes de las etapas que empeoraron.
+def comparar(resultados, base, tolerancia = 0.5):
+    regresiones = []
+    for nombre, actual in resultados["etapas"].items():
+        if nombre not in base["etapas"]:
+            continue
+        anterior = base["etapas"][nombre]
+        for medida in ("segundos", "pico_kib"):
+            if actual[medida] > anterior[medida] * (1 + tolerancia):
+                regresiones.append("{}: {} pasó de {} a {} (+{:.0%})".format(
+                    nombre, medida, anterior[medida], actual[medida], actual[medida] / anterior[medida] - 1))
+    return regresiones
+
+
+# --- FUNCIÓN PRINCIPAL DE LAS PRUEBAS DE RENDIMIENTO ---
+# Recibe un parámetro:
+# 1. argv -> argumentos de la línea de comandos (None usa los de "sys.argv").
+# Regresa 1 si se pidió comparar y alguna etapa empeoró; 0 en otro caso.
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Mide el rendimiento de cada etapa del programa de Tablas de Marea.")
+    parser.add_argument("--estaciones", type = int, default = 20, help = "número de estaciones sintéticas")
+    parser.add_argument("--years", type = int, default = 2, help = "número de años de cada estación")
+    parser.add_argument("--repeticiones", type = int, default = 5, help = "veces que se mide el tiempo de cada etapa")
+    parser.add_argument("--etapas", default = None, help = "etapas a medir, separadas por comas (por omisión, todas)")
+    parser.add_argument("--base", default = LINEA_BASE, help = "archivo JSON con la línea base")
+    parser.add_argument("--guardar", action = "store_true", help = "guarda los resultados como línea base")
+    parser.add_argument("--comparar", action = "store_true", help = "termina con error si alguna etapa empeora")
+    parser.add_argument("--tolerancia", type = float, default = 0.5, help = "aumento permitido sobre la línea base (0.5 = 50 %%)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        seleccion = args.etapas.split(",") if args.etapas else None
+        resultados = ejecutar(directorio, args.estaciones, args.years, args.repeticiones, seleccion)
+
+    configuracion = resultados["configuracion"]
+    print("{} estaciones x {} años = {} tablas".format(configuracion["estaciones"], configuracion["years"],
+                                                       configuracion["tablas"]))
+    print("{:<12} {:>10} {:>12} {:>14}".format("ETAPA", "SEGUNDOS", "PICO KiB", "TABLAS/S"))
+    for nombre, medidas in resultados["etapas"].items():
+        print("{:<12} {:>10.4f} {:>12.1f} {:>14.1f}".format(nombre, medidas["segundos"], medidas["pico_kib"],
+                                                           medidas["tablas_por_segundo"]))
+
+    if args.guardar:
+        with open(args.base, "w") as archivo:
+            json.dump(resultados, archivo, indent = 2)
+        print("Línea base guardada en " + args.base)
+
+    if args.comparar:
+        try:
+            with open(args.base) as archivo:
+                base = json.load(archivo)
+        except FileNotFoundError:
+            print("No hay línea base en {}; guárdela primero en este equipo con --guardar.".format(args.base))
+            return 1
+        # Los tiempos de otro equipo no sirven como referencia (las líneas base anteriores no traen el equipo).
+        if base["configuracion"].get("equipo") != configuracion["equipo"]:
+            print("La línea base se obtuvo en otro equipo: {}; guárdela de nuevo en este equipo con --guardar.".format(
+                base["configuracion"].get("equipo")))
+            return 1
+        # Solo se comparan resultados obtenidos con el mismo número de estaciones y años.
+        if base["configuracion"] != configuracion:
+            print("La línea base se obtuvo con otra configuración: {}".format(base["configuracion"]))
+            return 1
+        regresiones = comparar(resultados, base, args.tolerancia)
+        for mensaje in regresiones:
+            print("REGRESIÓN " + mensaje)
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto a la línea base.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
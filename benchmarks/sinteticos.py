@@ -0,0 +1,166 @@
+'''
+=== GENERADOR DE DATOS SINTÉTICOS PARA LAS PRUEBAS DE RENDIMIENTO ===
+
+Crea en una carpeta los archivos que necesita el programa de Tablas de Marea
+para N estaciones x M años:
+- ESTACIONES.txt y NBMI.txt con el nombre, meridiano y BMI de cada estación.
+- Un archivo HL<estación>.LIS por estación, con el mismo formato que los del
+  SPL64: desde el 31 de diciembre del año anterior hasta el 1 de enero del año
+  siguiente al último, incluyendo los años bisiestos del periodo.
+- unam_logo.png, una imagen pequeña para el fondo de las páginas del PDF.
+
+Las pleamares y bajamares se obtienen de una marea con las componentes M2, S2,
+K1 y O1, por lo que cada día tiene entre 3 y 5 eventos, como en los datos
+reales; además, algunos eventos se marcan al azar como vacíos (9999).
+
+Uso:
+~~~
+python -m benchmarks.sinteticos datos/ --estaciones 20 --years 3
+~~~
+'''
+
+import argparse
+import datetime
+import os
+import struct
+import zlib
+
+import numpy as np
+
+
+# Periodos en horas de las componentes de marea que se usan: M2, S2, K1 y O1.
+PERIODOS = np.array([12.4206, 12.0, 23.9345, 25.8193])
+
+# Número de la primera estación sintética (las estaciones reales del SMN usan números de 5 cifras).
+PRIMERA_ESTACION = 30001
+
+# Encabezado de los archivos .LIS.
+ENCABEZADO_LIS = "  STN DATE   HL  TIME  HGT  TIME  HGT  TIME  HGT  TIME  HGT  TIME  HGT"
+
+# Formato de cada registro .LIS: estación, día, mes y cinco pares hora/altura.
+FORMATO_LIS = " %6d %3d %3d" + " %5.4d %5d" * 5
+
+
+# --- FUNCIÓN PARA CALCULAR LAS PLEAMARES Y BAJAMARES DE UNA ESTACIÓN ---
+# Recibe tres parámetros:
+# 1. generador -> generador de números aleatorios de NumPy.
+# 2. dias -> número de días a calcular.
+# 3. nivelMedio -> nivel medio del mar en centímetros.
+# Regresa dos arreglos de "dias" x 5 con las horas (HHMM) y las alturas (cm) de cada evento...
+# con 9999 en los lugares sin evento.
+def eventos_marea(generador, dias, nivelMedio):
+    amplitudes = generador.uniform([30, 8, 10, 8], [60, 20, 35, 25])
+    fases = generador.uniform(0, 2 * np.pi, len(PERIODOS))
+
+    # Altura de la marea cada minuto; los extremos son los minutos donde cambia el signo de la pendiente.
+    minutos = np.arange(dias * 1440)
+    horas = minutos / 60
+    altura = nivelMedio + (amplitudes * np.cos(2 * np.pi * horas[:, None] / PERIODOS + fases)).sum(axis = 1)
+    pendiente = np.sign(np.diff(altura))
+    extremos = np.nonzero(pendiente[1:] != pendiente[:-1])[0] + 1
+
+    # Lugar de cada evento dentro de su día; se descartan los que pasan de 5.
+    dia = extremos // 1440
+    lugar = np.arange(len(extremos)) - np.searchsorted(dia, dia)
+    dentro = lugar < 5
+    extremos, dia, lugar = extremos[dentro], dia[dentro], lugar[dentro]
+
+    tiempos = np.full((dias, 5), 9999, dtype = np.int64)
+    alturas = np.full((dias, 5), 9999, dtype = np.int64)
+    minuto = extremos % 1440
+    tiempos[dia, lugar] = minuto // 60 * 100 + minuto % 60
+    alturas[dia, lugar] = np.round(altura[extremos])
+
+    # Algunos eventos se marcan como vacíos, igual que cuando el SPL64 no tiene datos.
+    huecos = generador.random((dias, 5)) < 0.005
+    tiempos[huecos] = 9999
+    alturas[huecos] = 9999
+    return tiempos, alturas
+
+
+# --- FUNCIÓN PARA OBTENER UN NOMBRE CON LETRAS A PARTIR DE UN NÚMERO ---
+# Recibe un número (desde 0) y regresa "A", "B", ..., "Z", "AA", "AB", ...
+# Los nombres no llevan números porque el separador de "ESTACIONES.txt" corta antes de dos dígitos.
+def nombre_letras(numero):
+    letras = ""
+    numero += 1
+    while numero > 0:
+        numero, resto = divmod(numero - 1, 26)
+        letras = chr(ord("A") + resto) + letras
+    return letras
+
+
+# --- FUNCIÓN PARA ESCRIBIR UNA IMAGEN PNG DE UN SOLO COLOR ---
+# Recibe la ruta de la imagen; fpdf necesita una imagen válida para el fondo de las páginas.
+def escribir_logo(ruta, ancho = 64, alto = 64):
+    def bloque(tipo, datos):
+        return struct.pack(">I", len(datos)) + tipo + datos + struct.pack(">I", zlib.crc32(tipo + datos))
+
+    filas = b"".join(b"\x00" + b"\xee\xee\xf4" * ancho for _ in range(alto))
+    with open(ruta, "wb") as archivo:
+        archivo.write(b"\x89PNG\r\n\x1a\n")
+        archivo.write(bloque(b"IHDR", struct.pack(">IIBBBBB", ancho, alto, 8, 2, 0, 0, 0)))
+        archivo.write(bloque(b"IDAT", zlib.compress(filas)))
+        archivo.write(bloque(b"IEND", b""))
+
+
+# --- FUNCIÓN PARA GENERAR LOS ARCHIVOS DE ENTRADA SINTÉTICOS ---
+# Recibe cinco parámetros:
+# 1. directorio -> carpeta donde se escriben los archivos (se crea si no existe).
+# 2. estaciones -> número de estaciones.
+# 3. years -> número de años de cada archivo .LIS.
+# 4. inicio -> primer año de los datos.
+# 5. semilla -> semilla de los números aleatorios, para obtener siempre los mismos archivos.
+# Regresa la lista de rutas de los archivos .LIS generados.
+def generar_datos(directorio, estaciones = 10, years = 1, inicio = 2024, semilla = 0):
+    os.makedirs(directorio, exist_ok = True)
+    generador = np.random.default_rng(semilla)
+
+    # Fechas de los registros: del 31 de diciembre del año anterior al 1 de enero del año siguiente.
+    primerDia = datetime.date(inicio - 1, 12, 31)
+    dias = (datetime.date(inicio + years, 1, 1) - primerDia).days + 1
+    fechas = [primerDia + datetime.timedelta(days = n) for n in range(dias)]
+    dia = np.array([fecha.day for fecha in fechas])
+    mes = np.array([fecha.month for fecha in fechas])
+
+    lineasEstaciones = []
+    lineasNBMI = ["000\tNOMBRE\tLAT\tLON\tMER\tBMI"]
+    archivos = []
+    for n in range(estaciones):
+        numero = PRIMERA_ESTACION + n
+        nombre = "ESTACION SINTETICA {}, MEX.".format(nombre_letras(n))
+        latitud, longitud = generador.uniform(15, 32), generador.uniform(86, 117)
+        meridiano = int(generador.choice([90, 105, 120]))
+        bmi = round(float(generador.uniform(40, 80)), 1)
+
+        lineasEstaciones.append("{} {} {:.0f} {:.1f} {:.0f} {:.1f}".format(numero, nombre, latitud, latitud % 1 * 60,
+                                                                          longitud, longitud % 1 * 60))
+        lineasNBMI.append("{}\t{}\t{:.2f}\t{:.2f}\t{}\t{}".format(numero, nombre, latitud, longitud, meridiano, bmi))
+
+        tiempos, alturas = eventos_marea(generador, dias, bmi + 60)
+        registros = np.column_stack([np.full(dias, numero), dia, mes,
+                                     np.stack([tiempos, alturas], axis = 2).reshape(dias, 10)])
+        archivo = os.path.join(directorio, "HL{}.LIS".format(numero))
+        np.savetxt(archivo, registros, fmt = FORMATO_LIS, header = ENCABEZADO_LIS, comments = "")
+        archivos.append(archivo)
+
+    with open(os.path.join(directorio, "ESTACIONES.txt"), "w") as archivo:
+        archivo.write("\n".join(lineasEstaciones) + "\n")
+    with open(os.path.join(directorio, "NBMI.txt"), "w") as archivo:
+        archivo.write("\n".join(lineasNBMI) + "\n")
+    escribir_logo(os.path.join(directorio, "unam_logo.png"))
+
+    return archivos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Genera archivos .LIS, ESTACIONES.txt y NBMI.txt sintéticos.")
+    parser.add_argument("directorio", help = "carpeta donde se escriben los archivos")
+    parser.add_argument("--estaciones", type = int, default = 10, help = "número de estaciones")
+    parser.add_argument("--years", type = int, default = 1, help = "número de años de cada archivo .LIS")
+    parser.add_argument("--inicio", type = int, default = 2024, help = "primer año de los datos")
+    parser.add_argument("--semilla", type = int, default = 0, help = "semilla de los números aleatorios")
+    args = parser.parse_args()
+
+    archivos = generar_datos(args.directorio, args.estaciones, args.years, args.inicio, args.semilla)
+    print("{} archivos .LIS generados en {}".format(len(archivos), args.directorio))
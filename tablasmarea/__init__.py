@@ -0,0 +1,50 @@
+'''
+=== PAQUETE DE APOYO PARA GENERAR TABLAS DE MAREA ===
+
+Funciones reutilizables del programa de Tablas de Marea del Servicio
+Mareográfico Nacional de la UNAM.
+
+Módulos:
+- cache_lis -> caché binario (.npy) de las columnas de los archivos .LIS.
+- consulta -> altura de la marea a cualquier hora, interpolando entre pleamares y bajamares.
+- estaciones -> registro con los datos de las estaciones (ESTACIONES.txt y NBMI.txt).
+- estadisticas -> rango diario, pleamar y bajamar media mensual y extremos anuales por estación.
+- exportar -> exporta las tablas a CSV, JSON y HTML (formatos que se pueden ampliar).
+- generador -> genera las tablas de una estación en memoria o en archivos TXT y PDF.
+- incremental -> vuelve a generar solo los meses que cambiaron desde la ejecución anterior.
+- lis -> lectura de los archivos .LIS generados con el programa SPL64.
+- lote -> genera las tablas de varios archivos .LIS en paralelo.
+- maquetado -> acomoda los datos del archivo .LIS en la tabla de cada mes.
+- perfil -> mide el tiempo y la memoria de cada etapa (opcional, con registros JSON).
+- pdf -> dibuja las tablas en PDF, por estación o en un atlas (único módulo que usa fpdf).
+- salida -> escritura de los archivos de salida (atómica y página por página).
+- servidor -> servidor HTTP local que entrega las tablas bajo pedido, con caché de resultados.
+- texto -> escribe el texto de ancho fijo de la página de cada mes.
+
+Uso desde otros programas:
+~~~
+from tablasmarea import generar_tablas
+resultado = generar_tablas("HL25023.LIS", 2023, formatos = ("txt",))
+~~~
+'''
+
+import importlib
+
+
+# Funciones que se pueden importar directamente desde el paquete y el módulo donde se encuentran.
+# Los módulos se importan hasta que se usa la función, para no cargar Pandas al importar el paquete.
+_FUNCIONES = {"generar_tablas": "tablasmarea.generador",
+              "generar_estacion": "tablasmarea.generador",
+              "cargar_estaciones": "tablasmarea.estaciones",
+              "eventos_estacion": "tablasmarea.consulta",
+              "altura_marea": "tablasmarea.consulta",
+              "estadisticas_estaciones": "tablasmarea.estadisticas",
+              "leer_lis": "tablasmarea.lis"}
+
+__all__ = list(_FUNCIONES)
+
+
+def __getattr__(nombre):
+    if nombre not in _FUNCIONES:
+        raise AttributeError("module 'tablasmarea' has no attribute " + repr(nombre))
+    return getattr(importlib.import_module(_FUNCIONES[nombre]), nombre)
@@ -0,0 +1,155 @@
+'''
+=== CACHÉ BINARIO DE LOS ARCHIVOS .LIS ===
+
+La primera vez que se lee un archivo .LIS, sus columnas se guardan en formato
+binario de NumPy (.npy) en la carpeta ".cache_lis", junto al archivo:
+- <archivo .LIS>-<hash>.fechas.npy -> arreglo int32 de 3 x N con STN, DATE y HL.
+- <archivo .LIS>-<hash>.eventos.npy -> arreglo int16 de 10 x N con los pares TIME/HGT.
+
+"hash" es el SHA-1 del contenido del archivo .LIS, por lo que si el archivo
+cambia se vuelve a leer el texto. En las siguientes lecturas los arreglos se
+abren con "mmap_mode", sin copiarlos ni convertir texto: cada columna es una
+fila contigua del arreglo.
+
+Para no leer y calcular el hash de todo el archivo en cada lectura, en
+"<archivo .LIS>.firma" se guarda su fecha de modificación y tamaño junto con
+su hash; el hash solo se vuelve a calcular cuando la firma cambia. Al guardar
+los arreglos de un archivo se borran los de sus versiones anteriores, por lo
+que el caché no crece con cada corrección; los de otros archivos de la misma
+estación en la carpeta (por ejemplo, de otro año) se conservan.
+
+Las alturas se guardan en centímetros, sin restar el BMI, porque el BMI tiene
+decimales y la resta se hace en un solo paso al preparar los datos; así las
+alturas de las tablas son exactamente las mismas que al leer el texto.
+'''
+
+import glob
+import hashlib
+import io
+import os
+
+import numpy as np
+
+from tablasmarea.lis import DatosLIS, leer_lis
+from tablasmarea.salida import escritura_atomica
+
+
+# Nombre de la carpeta del caché, junto a los archivos .LIS.
+CARPETA_CACHE = ".cache_lis"
+
+
+# --- FUNCIÓN PARA OBTENER LA CARPETA DEL CACHÉ DE UN ARCHIVO .LIS ---
+def carpeta_cache(archivoDatos):
+    return os.path.join(os.path.dirname(os.path.abspath(archivoDatos)), CARPETA_CACHE)
+
+
+# --- FUNCIÓN PARA LEER EL HASH GUARDADO DE UN ARCHIVO .LIS ---
+# Recibe tres parámetros:
+# 1. carpeta -> carpeta del caché.
+# 2. archivoDatos -> ruta del archivo .LIS.
+# 3. firma -> tupla con la fecha de modificación y el tamaño actuales del archivo.
+# Regresa el hash guardado si la firma no cambió, o None en otro caso.
+def leer_firma(carpeta, archivoDatos, firma):
+    try:
+        with open(os.path.join(carpeta, os.path.basename(archivoDatos) + ".firma")) as archivo:
+            modificacion, tamano, hashArchivo = archivo.read().split()
+    except (OSError, ValueError):
+        return None
+    return hashArchivo if (int(modificacion), int(tamano)) == firma else None
+
+
+# --- FUNCIÓN PARA GUARDAR EL HASH DE UN ARCHIVO .LIS JUNTO CON SU FIRMA ---
+# Si la carpeta no permite escritura, simplemente no se guarda.
+def guardar_firma(carpeta, archivoDatos, firma, hashArchivo):
+    try:
+        os.makedirs(carpeta, exist_ok = True)
+        with escritura_atomica(os.path.join(carpeta, os.path.basename(archivoDatos) + ".firma"), "w") as archivo:
+            archivo.write("{} {} {}\n".format(firma[0], firma[1], hashArchivo))
+    except OSError:
+        pass
+
+
+# --- FUNCIÓN PARA BUSCAR EN EL CACHÉ LAS COLUMNAS DE UN ARCHIVO .LIS ---
+# Recibe dos parámetros:
+# 1. carpeta -> carpeta del caché.
+# 2. hashArchivo -> SHA-1 del contenido del archivo .LIS.
+# Regresa un contenedor "DatosLIS" con arreglos de solo lectura, o None si no está en el caché.
+def buscar_cache(carpeta, hashArchivo):
+    for rutaFechas in glob.glob(os.path.join(carpeta, "*-" + hashArchivo + ".fechas.npy")):
+        try:
+            fechas = np.load(rutaFechas, mmap_mode = "r")
+            eventos = np.load(rutaFechas[:-len(".fechas.npy")] + ".eventos.npy", mmap_mode = "r")
+        except (OSError, ValueError):
+            continue
+        # Cada columna es una fila contigua; "tiempos" y "alturas" son vistas de N x 5 sin copia.
+        return DatosLIS(estacion = fechas[0], fecha = fechas[1], hl = fechas[2],
+                        tiempos = eventos[0::2].T, alturas = eventos[1::2].T)
+    return None
+
+
+# --- FUNCIÓN PARA GUARDAR EN EL CACHÉ LAS COLUMNAS DE UN ARCHIVO .LIS ---
+# Recibe cuatro parámetros:
+# 1. carpeta -> carpeta del caché (se crea si no existe).
+# 2. archivoDatos -> ruta del archivo .LIS; su nombre forma parte del nombre de los arreglos.
+# 3. hashArchivo -> SHA-1 del contenido del archivo .LIS.
+# 4. datos -> contenedor "DatosLIS" que regresa "leer_lis".
+# Después se borran los arreglos del mismo archivo con otro hash (sus versiones anteriores).
+# Si la carpeta no permite escritura, simplemente no se guarda el caché.
+def guardar_cache(carpeta, archivoDatos, hashArchivo, datos):
+    fechas = np.stack([datos.estacion, datos.fecha, datos.hl]).astype(np.int32)
+    eventos = np.empty((10, len(datos.fecha)), dtype = np.int16)
+    eventos[0::2] = datos.tiempos.T
+    eventos[1::2] = datos.alturas.T
+
+    nombre = os.path.basename(archivoDatos)
+    base = os.path.join(carpeta, "{}-{}".format(nombre, hashArchivo))
+    try:
+        os.makedirs(carpeta, exist_ok = True)
+        # Los eventos se escriben primero: solo se busca en el caché a partir del archivo de fechas.
+        for sufijo, arreglo in ((".eventos.npy", eventos), (".fechas.npy", fechas)):
+            with escritura_atomica(base + sufijo, "wb") as archivo:
+                np.save(archivo, arreglo)
+        # Primero se borra el archivo de fechas, para que nunca quede uno sin su archivo de eventos. Solo...
+        # se borran los nombres "<archivo>-<hash de 40 caracteres>", no los de otro archivo cuyo nombre...
+        # comience igual.
+        for sufijo in (".fechas.npy", ".eventos.npy"):
+            for ruta in glob.glob(os.path.join(carpeta, glob.escape(nombre) + "-*" + sufijo)):
+                if ruta != base + sufijo and len(os.path.basename(ruta)) == len(nombre) + 41 + len(sufijo):
+                    os.remove(ruta)
+    except OSError:
+        pass
+
+
+# --- FUNCIÓN PARA LEER UN ARCHIVO .LIS USANDO EL CACHÉ ---
+# Recibe un parámetro:
+# 1. archivoDatos -> ruta del archivo .LIS (si es un archivo abierto, se lee sin usar el caché; si ya es...
+#    un contenedor "DatosLIS", por ejemplo de "leer_bloques_lis", se regresa tal cual).
+# Regresa un contenedor "DatosLIS", igual que "leer_lis".
+def cargar_lis(archivoDatos):
+    if isinstance(archivoDatos, DatosLIS):
+        return archivoDatos
+    if hasattr(archivoDatos, "read"):
+        return leer_lis(archivoDatos)
+
+    carpeta = carpeta_cache(archivoDatos)
+    estado = os.stat(archivoDatos)
+    firma = (estado.st_mtime_ns, estado.st_size)
+
+    # Si la firma no cambió, el hash guardado basta para buscar en el caché sin leer el archivo.
+    hashArchivo = leer_firma(carpeta, archivoDatos, firma)
+    if hashArchivo is not None:
+        datos = buscar_cache(carpeta, hashArchivo)
+        if datos is not None:
+            return datos
+
+    with open(archivoDatos, "rb") as archivo:
+        contenido = archivo.read()
+    hashArchivo = hashlib.sha1(contenido).hexdigest()
+
+    datos = buscar_cache(carpeta, hashArchivo)
+    if datos is None:
+        # El texto ya está en memoria, por lo que no se vuelve a leer del disco.
+        datos = leer_lis(io.BytesIO(contenido))
+        guardar_cache(carpeta, archivoDatos, hashArchivo, datos)
+    guardar_firma(carpeta, archivoDatos, firma, hashArchivo)
+    return datos
@@ -0,0 +1,177 @@
+'''
+=== CONSULTA DE LA ALTURA DE LA MAREA A CUALQUIER HORA ===
+
+El archivo .LIS solo trae las horas y alturas de las pleamares y bajamares.
+Este módulo estima la altura en cualquier instante interpolando con un coseno
+entre los dos eventos vecinos, que es la forma de la curva de marea entre un
+extremo y el siguiente:
+
+    altura = h0 + (h1 - h0) * (1 - cos(pi * (t - t0) / (t1 - t0))) / 2
+
+Solo se interpola entre una pleamar y una bajamar consecutivas. Si falta un
+evento (9999 en el .LIS), la marea sube o baja en dos intervalos seguidos, el
+intervalo contiene el lugar vacío o es más largo de lo normal en la estación;
+en esos intervalos la consulta regresa NaN.
+
+Las alturas se refieren al BMI de la estación, igual que en las tablas, y las
+horas son las del meridiano de la estación. Todas las consultas se resuelven
+con operaciones de NumPy ("searchsorted" sobre las horas de los eventos), por
+lo que se pueden pedir millones de instantes a la vez.
+
+Uso:
+~~~
+python -m tablasmarea.consulta HL25023.LIS --year 2023 --desde 2023-03-01T00:00 --hasta 2023-03-02T00:00 --cada 10
+~~~
+'''
+
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from tablasmarea.generador import preparar_datos
+from tablasmarea.maquetado import METROS_A_PIES, SIN_DATO
+
+
+# Separación máxima entre dos eventos para interpolar entre ellos, como múltiplo de la separación...
+# típica (mediana) de la estación: unas 11 horas en una estación semidiurna y unas 22 en una diurna.
+FACTOR_HUECO = 1.75
+
+# Eventos de marea de una estación, en orden cronológico:
+# estacion -> datos de la estación (nombre, meridiano y BMI).
+# instantes -> fecha y hora de cada evento (datetime64 en minutos).
+# alturas -> altura de cada evento en centímetros, ya sin el BMI.
+# faltantes -> True si entre el evento y el siguiente hay un evento vacío (9999) en el .LIS.
+EventosMarea = namedtuple("EventosMarea", ["estacion", "instantes", "alturas", "faltantes"])
+
+
+# --- FUNCIÓN PARA OBTENER LOS EVENTOS DE MAREA DE UNA ESTACIÓN ---
+# Recibe los mismos parámetros que "generar_tablas", salvo "formatos", "desde" y "hasta".
+# Usa todos los registros del archivo .LIS, incluidos los días de meses incompletos al inicio y al final.
+# Regresa un contenedor "EventosMarea".
+def eventos_estacion(archivoDatos, year = None, estaciones = None, directorioDatos = "."):
+    return eventos_datos(preparar_datos(archivoDatos, year, estaciones, directorioDatos))
+
+
+# --- FUNCIÓN PARA OBTENER LOS EVENTOS DE MAREA A PARTIR DE LOS DATOS YA PREPARADOS ---
+# Recibe un parámetro:
+# 1. datos -> contenedor "DatosEstacion" que regresa "preparar_datos".
+# Regresa un contenedor "EventosMarea".
+def eventos_datos(datos):
+    # Día de cada registro: primer día de su mes (a partir de la clave año * 12 + mes - 1) más el día del mes.
+    inicioMes = (np.asarray(datos.claves) - 1970 * 12).astype("datetime64[M]").astype("datetime64[D]")
+    dias = inicioMes + (np.asarray(datos.fecha) % 100 - 1).astype("timedelta64[D]")
+
+    # Fecha y hora de cada evento; se descartan los eventos vacíos.
+    horas = np.asarray(datos.tiempos, dtype = np.int64)
+    minutos = (horas // 100 * 60 + horas % 100).astype("timedelta64[m]")
+    instantes = dias.astype("datetime64[m]")[:, None] + minutos
+    conDato = horas != SIN_DATO
+
+    # Un lugar vacío seguido, en el mismo registro, de un evento con dato es un evento que falta; los...
+    # lugares vacíos al final del registro solo completan los cinco lugares del día.
+    siguientes = np.cumsum(conDato[:, ::-1], axis = 1)[:, ::-1]
+    acumulado = np.cumsum((~conDato & (siguientes > 0)).ravel())
+    posiciones = np.flatnonzero(conDato.ravel())
+    faltantes = np.zeros(len(posiciones), dtype = bool)
+    faltantes[:-1] = acumulado[posiciones[1:]] > acumulado[posiciones[:-1]]
+
+    instantes, alturas = instantes[conDato], np.asarray(datos.alturas, dtype = np.float64)[conDato]
+    orden = np.argsort(instantes, kind = "stable")
+    return EventosMarea(datos.estacion, instantes[orden], alturas[orden], faltantes[orden])
+
+
+# --- FUNCIÓN PARA IDENTIFICAR LOS INTERVALOS QUE ALTERNAN ENTRE PLEAMAR Y BAJAMAR ---
+# Recibe un arreglo con las alturas de los eventos en orden cronológico.
+# Regresa un arreglo booleano con un valor por intervalo entre dos eventos consecutivos: False si...
+# la marea sube (o baja) igual que en un intervalo vecino, lo que indica que falta un evento entre ellos.
+def intervalos_alternados(alturas):
+    signo = np.sign(np.diff(np.asarray(alturas, dtype = np.float64)))
+    repetido = np.zeros(len(signo), dtype = bool)
+    repetido[1:] |= signo[1:] == signo[:-1]
+    repetido[:-1] |= signo[:-1] == signo[1:]
+    return ~repetido
+
+
+# --- FUNCIÓN PARA IDENTIFICAR LOS INTERVALOS DONDE SE PUEDE INTERPOLAR ---
+# Recibe dos parámetros:
+# 1. eventos -> contenedor "EventosMarea" que regresa "eventos_estacion".
+# 2. huecoMaximo -> separación máxima en minutos entre dos eventos; None usa "FACTOR_HUECO".
+# Regresa un arreglo booleano con un valor por intervalo entre dos eventos consecutivos. Un intervalo...
+# no es válido si es demasiado largo, si contiene un evento vacío o si no alterna con sus vecinos.
+def intervalos_validos(eventos, huecoMaximo = None):
+    duracion = np.diff(eventos.instantes.astype("datetime64[m]").astype(np.int64))
+    if huecoMaximo is None:
+        huecoMaximo = FACTOR_HUECO * np.median(duracion) if len(duracion) else 0
+    return (duracion <= huecoMaximo) & ~eventos.faltantes[:-1] & intervalos_alternados(eventos.alturas)
+
+
+# --- FUNCIÓN PARA CALCULAR LA ALTURA DE LA MAREA EN VARIOS INSTANTES ---
+# Recibe tres parámetros:
+# 1. eventos -> contenedor "EventosMarea" que regresa "eventos_estacion".
+# 2. instantes -> fecha y hora, o arreglo de fechas y horas (datetime64 o textos como "2023-03-01T10:30").
+# 3. huecoMaximo -> separación máxima en minutos entre dos eventos; None usa "FACTOR_HUECO".
+# Regresa dos arreglos con la altura en PIES y en METROS de cada instante; los instantes fuera...
+# del periodo de los datos o en un intervalo no válido (ver "intervalos_validos") tienen NaN.
+def altura_marea(eventos, instantes, huecoMaximo = None):
+    # Se trabaja con segundos desde 1970 para que "searchsorted" compare enteros.
+    t = eventos.instantes.astype("datetime64[s]").astype(np.int64)
+    consulta = np.asarray(instantes, dtype = "datetime64[s]").astype(np.int64)
+    if len(t) < 2:
+        vacio = np.full(consulta.shape, np.nan)
+        return vacio, vacio.copy()
+
+    # i -> índice del evento siguiente a cada consulta; "i - 1" es el evento anterior.
+    i = np.clip(np.searchsorted(t, consulta, side = "right"), 1, len(t) - 1)
+    t0, t1 = t[i - 1], t[i]
+    h0, h1 = eventos.alturas[i - 1], eventos.alturas[i]
+
+    fraccion = (consulta - t0) / np.maximum(t1 - t0, 1)
+    centimetros = h0 + (h1 - h0) * (1 - np.cos(np.pi * fraccion)) / 2
+
+    # Fuera del periodo de los datos o donde falta un evento, no se interpola.
+    invalido = (fraccion < 0) | (fraccion > 1) | ~intervalos_validos(eventos, huecoMaximo)[i - 1]
+    centimetros = np.where(invalido, np.nan, centimetros)
+
+    metros = centimetros / 100
+    return metros * METROS_A_PIES, metros
+
+
+# --- FUNCIÓN PARA CALCULAR LA ALTURA DE LA MAREA A INTERVALOS REGULARES ---
+# Recibe cuatro parámetros:
+# 1. eventos -> contenedor "EventosMarea" que regresa "eventos_estacion".
+# 2. inicio -> fecha y hora inicial (datetime64 o texto como "2023-03-01T00:00").
+# 3. fin -> fecha y hora final, incluida si cae en el intervalo.
+# 4. cada -> minutos entre cada consulta.
+# Regresa los instantes y sus alturas en PIES y en METROS.
+def serie_marea(eventos, inicio, fin, cada = 10):
+    instantes = np.arange(np.datetime64(inicio, "m"), np.datetime64(fin, "m") + np.timedelta64(1, "m"),
+                          np.timedelta64(cada, "m"))
+    pies, metros = altura_marea(eventos, instantes)
+    return instantes, pies, metros
+
+
+# --- FUNCIÓN PRINCIPAL DE LA CONSULTA ---
+# Recibe un parámetro:
+# 1. argv -> argumentos de la línea de comandos (None usa los de "sys.argv").
+# Escribe una línea "FECHA,PIES,METROS" por cada instante.
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Calcula la altura de la marea a intervalos regulares.")
+    parser.add_argument("archivo", help = "archivo .LIS de la estación")
+    parser.add_argument("--year", type = int, default = None, help = "año del primer mes completo de los datos")
+    parser.add_argument("--datos", default = ".", help = "carpeta con ESTACIONES.txt y NBMI.txt")
+    parser.add_argument("--desde", required = True, help = "fecha y hora inicial, como 2023-03-01T00:00")
+    parser.add_argument("--hasta", required = True, help = "fecha y hora final, como 2023-03-02T00:00")
+    parser.add_argument("--cada", type = int, default = 10, help = "minutos entre cada consulta")
+    args = parser.parse_args(argv)
+
+    eventos = eventos_estacion(args.archivo, args.year, None, args.datos)
+    instantes, pies, metros = serie_marea(eventos, args.desde, args.hasta, args.cada)
+    print("FECHA,PIES,METROS")
+    for instante, alturaPies, alturaMetros in zip(instantes, pies, metros):
+        print("{},{:.3f},{:.3f}".format(instante, alturaPies, alturaMetros))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
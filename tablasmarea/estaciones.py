@@ -0,0 +1,142 @@
+'''
+=== REGISTRO DE LAS ESTACIONES MAREOGRÁFICAS ===
+
+Lee una sola vez los archivos "ESTACIONES.txt" y "NBMI.txt" y los reúne en un
+diccionario indexado por número de estación, con su nombre, meridiano y BMI.
+
+El diccionario se guarda en el archivo ".estaciones.cache", junto a los
+archivos originales, y solo se vuelve a construir cuando cambia la fecha de
+modificación y el contenido de alguno de ellos.
+'''
+
+import hashlib
+import os
+import pickle
+from collections import namedtuple
+
+import pandas as pd
+
+from tablasmarea.salida import escritura_atomica
+
+
+# Archivos con los datos de las estaciones y nombre del archivo de caché.
+ARCHIVOS_ESTACIONES = ("ESTACIONES.txt", "NBMI.txt")
+ARCHIVO_CACHE = ".estaciones.cache"
+
+# Datos de una estación:
+# numero -> número de la estación.
+# nombre -> nombre de la estación (ESTACIONES.txt).
+# meridiano -> meridiano de la hora de la estación en grados (NBMI.txt).
+# bmi -> promedio de bajamar de la estación (NBMI.txt).
+Estacion = namedtuple("Estacion", ["numero", "nombre", "meridiano", "bmi"])
+
+# Registros ya cargados en este proceso, indexados por carpeta.
+_registros = {}
+
+
+# --- FUNCIÓN PARA LEER LOS ARCHIVOS CON LOS DATOS DE LAS ESTACIONES ---
+# Recibe un parámetro:
+# 1. directorio -> carpeta donde se encuentran "ESTACIONES.txt" y "NBMI.txt".
+# Regresa los DataFrames "estaciones" (ESTACIONES.txt) y "ff" (NBMI.txt).
+def leer_estaciones(directorio = "."):
+    # Usamos una Expresión Regular (RegEx) para obtener la separación adecuada de las columnas.
+    # Especificamos "Python" como valor de "engine" para evitar problemas al tratar con RegEx.
+    estaciones = pd.read_csv(os.path.join(directorio, "ESTACIONES.txt"),
+                             # Lógica de la Expresión Regular:
+                             # espacios después de un punto | espacios después de un número | espacios antes de dos números o más
+                             sep=r"(?<=\.)\s+|(?<=[0-9])\s+|\s+(?=\d{2})",
+                             engine="python",
+                             header = None)
+
+    ff = pd.read_csv(os.path.join(directorio, "NBMI.txt"),
+                     # Lógica de la Expresión Regular:
+                     # tabulación + un espacio o más | tres espacios o más | tabulaciones
+                     sep=r"\t+\s{1,}|\s{3,}|\t",
+                     engine="python")
+
+    return estaciones, ff
+
+
+# --- FUNCIÓN PARA CONSTRUIR EL REGISTRO DE ESTACIONES ---
+# Recibe un parámetro:
+# 1. directorio -> carpeta donde se encuentran "ESTACIONES.txt" y "NBMI.txt".
+# Regresa un diccionario {número de estación: Estacion} con las estaciones que aparecen en ambos archivos.
+def construir_registro(directorio = "."):
+    estaciones, ff = leer_estaciones(directorio)
+    # nombres -> número de estación (columna 0) y su nombre (columna 1) en "ESTACIONES.txt".
+    nombres = dict(zip(estaciones[0].astype(int), estaciones[1]))
+
+    registro = {}
+    # En "NBMI.txt" la columna 0 es el número de estación, la 4 el meridiano y la 5 el BMI.
+    for fila in ff.itertuples(index = False):
+        numero = int(fila[0])
+        if numero in nombres:
+            registro[numero] = Estacion(numero, nombres[numero], int(fila[4]), float(fila[5]))
+    return registro
+
+
+# --- FUNCIÓN PARA OBTENER LA FIRMA DE LOS ARCHIVOS DE ESTACIONES ---
+# Recibe un parámetro:
+# 1. directorio -> carpeta donde se encuentran "ESTACIONES.txt" y "NBMI.txt".
+# Regresa una tupla con la fecha de modificación y el tamaño de cada archivo.
+def _firma(directorio):
+    firma = []
+    for nombre in ARCHIVOS_ESTACIONES:
+        estado = os.stat(os.path.join(directorio, nombre))
+        firma.append((estado.st_mtime_ns, estado.st_size))
+    return tuple(firma)
+
+
+# --- FUNCIÓN PARA OBTENER EL HASH DEL CONTENIDO DE LOS ARCHIVOS DE ESTACIONES ---
+def _hash(directorio):
+    resumen = hashlib.sha1()
+    for nombre in ARCHIVOS_ESTACIONES:
+        with open(os.path.join(directorio, nombre), "rb") as archivo:
+            resumen.update(archivo.read())
+    return resumen.hexdigest()
+
+
+# --- FUNCIÓN PARA GUARDAR EL ARCHIVO DE CACHÉ ---
+# Se escribe en un archivo temporal que luego reemplaza al anterior, para no dejar un caché a medias.
+# Si la carpeta no permite escritura, simplemente no se guarda el caché.
+def _guardar_cache(directorio, contenido):
+    try:
+        with escritura_atomica(os.path.join(directorio, ARCHIVO_CACHE), "wb") as archivo:
+            pickle.dump(contenido, archivo, protocol = pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+# --- FUNCIÓN PARA CARGAR EL REGISTRO DE ESTACIONES ---
+# Recibe un parámetro:
+# 1. directorio -> carpeta donde se encuentran "ESTACIONES.txt" y "NBMI.txt".
+# Usa, en este orden: el registro ya cargado en el proceso, el archivo de caché...
+# o la lectura de los archivos originales. Regresa un diccionario {número de estación: Estacion}.
+def cargar_estaciones(directorio = "."):
+    clave = os.path.realpath(directorio)
+    firma = _firma(directorio)
+    if clave in _registros and _registros[clave][0] == firma:
+        return _registros[clave][1]
+
+    # Si el archivo de caché no existe o está dañado, se construye de nuevo.
+    cache = None
+    try:
+        with open(os.path.join(directorio, ARCHIVO_CACHE), "rb") as archivo:
+            cache = pickle.load(archivo)
+    except Exception:
+        pass
+
+    if cache is not None and cache["firma"] == firma:
+        registro = cache["estaciones"]
+    else:
+        # Si solo cambió la fecha de modificación pero no el contenido, se conserva el registro.
+        hashArchivos = _hash(directorio)
+        if cache is not None and cache["hash"] == hashArchivos:
+            registro = cache["estaciones"]
+        else:
+            registro = construir_registro(directorio)
+        _guardar_cache(directorio, {"firma": firma, "hash": hashArchivos, "estaciones": registro})
+
+    _registros[clave] = (firma, registro)
+    return registro
+
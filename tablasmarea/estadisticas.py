@@ -0,0 +1,126 @@
+'''
+=== ESTADÍSTICAS DE MAREA POR ESTACIÓN ===
+
+Calcula, a partir de las horas y alturas del archivo .LIS (ya sin el BMI), los
+productos que antes se obtenían a mano del TXT:
+- diario -> pleamar más alta, bajamar más baja y rango de marea de cada día.
+- mensual -> pleamar media y bajamar media de cada mes (y su diferencia).
+- anual -> pleamar más alta y bajamar más baja de cada año, con su fecha y hora.
+
+Un evento es pleamar si la marea sube hasta él y baja después, y bajamar en
+el caso contrario. Los intervalos donde falta un evento (ver
+"consulta.intervalos_validos") no se usan: el evento se clasifica con su otro
+vecino, y si no tiene ninguno válido queda sin clasificar y se avisa. Todas las estadísticas se obtienen con
+agrupaciones de Pandas sobre los eventos de una o varias estaciones a la vez;
+cada tabla trae la columna ESTACION.
+
+Las alturas están en metros, con la misma referencia que las tablas.
+'''
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from tablasmarea.consulta import eventos_datos, intervalos_alternados, intervalos_validos
+from tablasmarea.salida import escritura_atomica
+
+
+# Productos que se calculan y sufijo del archivo CSV de cada uno.
+PRODUCTOS = ("diario", "mensual", "anual")
+
+
+# --- FUNCIÓN PARA IDENTIFICAR LAS PLEAMARES Y BAJAMARES ---
+# Recibe dos parámetros:
+# 1. alturas -> alturas de los eventos en orden cronológico.
+# 2. validos -> arreglo booleano por intervalo entre eventos ("intervalos_validos"); None solo...
+#    descarta los intervalos que no alternan ("intervalos_alternados").
+# Regresa dos arreglos booleanos: pleamares y bajamares. Un evento sin intervalos válidos a sus...
+# lados (o en un extremo de la serie, sin su único intervalo) no es pleamar ni bajamar.
+def clasificar_eventos(alturas, validos = None):
+    if validos is None:
+        validos = intervalos_alternados(alturas)
+    # Sentido de la marea en cada intervalo: 1 sube, -1 baja y 0 si no es válido.
+    signo = np.where(validos, np.sign(np.diff(np.asarray(alturas, dtype = np.float64))), 0)
+    anterior = np.concatenate(([0], signo))
+    siguiente = np.concatenate((signo, [0]))
+    pleamar = (anterior >= 0) & (siguiente <= 0) & ((anterior > 0) | (siguiente < 0))
+    bajamar = (anterior <= 0) & (siguiente >= 0) & ((anterior < 0) | (siguiente > 0))
+    return pleamar, bajamar
+
+
+# --- FUNCIÓN PARA ARMAR LA TABLA DE EVENTOS DE UNA ESTACIÓN ---
+# Recibe un parámetro:
+# 1. datos -> contenedor "DatosEstacion" que regresa "preparar_datos".
+# Regresa un DataFrame con las columnas ESTACION, INSTANTE, METROS, PLEAMAR y BAJAMAR, solo con...
+# los eventos de los meses de "datos.meses" (los vecinos fuera del rango sí se usan para clasificarlos).
+def tabla_eventos(datos):
+    eventos = eventos_datos(datos)
+    pleamar, bajamar = clasificar_eventos(eventos.alturas, intervalos_validos(eventos))
+
+    # Periodo de los meses pedidos: del primer día del primer mes al primer día del mes siguiente al último.
+    primero, ultimo = datos.meses[0], datos.meses[-1]
+    inicio = np.datetime64("{}-{:02d}".format(primero[0], primero[1]), "M")
+    fin = np.datetime64("{}-{:02d}".format(ultimo[0], ultimo[1]), "M") + np.timedelta64(1, "M")
+    dentro = (eventos.instantes >= inicio) & (eventos.instantes < fin)
+
+    sinClasificar = np.count_nonzero(dentro & ~pleamar & ~bajamar)
+    if sinClasificar:
+        warnings.warn("Estación {}: {} eventos junto a un evento faltante no se clasificaron como pleamar "
+                      "ni bajamar.".format(eventos.estacion.numero, sinClasificar))
+
+    return pd.DataFrame({"ESTACION": eventos.estacion.numero,
+                         "INSTANTE": eventos.instantes[dentro],
+                         "METROS": eventos.alturas[dentro] / 100,
+                         "PLEAMAR": pleamar[dentro],
+                         "BAJAMAR": bajamar[dentro]})
+
+
+# --- FUNCIÓN PARA CALCULAR LAS ESTADÍSTICAS DE UNA TABLA DE EVENTOS ---
+# Recibe un parámetro:
+# 1. eventos -> DataFrame que regresa "tabla_eventos" (o varios concatenados).
+# Regresa un diccionario {producto: DataFrame} con los productos "diario", "mensual" y "anual".
+def calcular_estadisticas(eventos):
+    instante = eventos["INSTANTE"]
+    eventos = eventos.assign(FECHA = instante.dt.strftime("%Y-%m-%d"), YEAR = instante.dt.year, MES = instante.dt.month)
+    pleamares = eventos[eventos["PLEAMAR"]]
+    bajamares = eventos[eventos["BAJAMAR"]]
+
+    diario = eventos.groupby(["ESTACION", "FECHA"])["METROS"].agg(MAXIMA = "max", MINIMA = "min").reset_index()
+    diario["RANGO"] = diario["MAXIMA"] - diario["MINIMA"]
+
+    mensual = pd.concat([pleamares.groupby(["ESTACION", "YEAR", "MES"])["METROS"].mean().rename("PLEAMAR_MEDIA"),
+                         bajamares.groupby(["ESTACION", "YEAR", "MES"])["METROS"].mean().rename("BAJAMAR_MEDIA")],
+                        axis = 1).reset_index()
+    mensual["RANGO_MEDIO"] = mensual["PLEAMAR_MEDIA"] - mensual["BAJAMAR_MEDIA"]
+
+    # Con "idxmax" e "idxmin" se obtiene, en la misma agrupación, el evento donde ocurre cada extremo.
+    alta = pleamares.loc[pleamares.groupby(["ESTACION", "YEAR"])["METROS"].idxmax(), ["ESTACION", "YEAR", "METROS", "INSTANTE"]]
+    baja = bajamares.loc[bajamares.groupby(["ESTACION", "YEAR"])["METROS"].idxmin(), ["ESTACION", "YEAR", "METROS", "INSTANTE"]]
+    anual = pd.merge(alta.rename(columns = {"METROS": "PLEAMAR_MAXIMA", "INSTANTE": "FECHA_PLEAMAR_MAXIMA"}),
+                     baja.rename(columns = {"METROS": "BAJAMAR_MINIMA", "INSTANTE": "FECHA_BAJAMAR_MINIMA"}),
+                     on = ["ESTACION", "YEAR"], how = "outer")
+
+    return {"diario": diario, "mensual": mensual, "anual": anual}
+
+
+# --- FUNCIÓN PARA CALCULAR LAS ESTADÍSTICAS DE VARIAS ESTACIONES A LA VEZ ---
+# Recibe una lista de contenedores "DatosEstacion" que regresa "preparar_datos".
+# Los eventos de todas las estaciones se reúnen en un solo DataFrame y se agrupan en una sola pasada.
+def estadisticas_estaciones(listaDatos):
+    return calcular_estadisticas(pd.concat([tabla_eventos(datos) for datos in listaDatos], ignore_index = True))
+
+
+# --- FUNCIÓN PARA ESCRIBIR LAS ESTADÍSTICAS EN ARCHIVOS CSV ---
+# Recibe dos parámetros:
+# 1. estadisticas -> diccionario que regresa "calcular_estadisticas".
+# 2. archivoBase -> ruta sin extensión; se escribe un archivo "<archivoBase>.<producto>.csv" por producto.
+# Regresa la lista de rutas de los archivos generados.
+def escribir_estadisticas(estadisticas, archivoBase):
+    archivos = []
+    for producto in PRODUCTOS:
+        ruta = archivoBase + "." + producto + ".csv"
+        with escritura_atomica(ruta, "w") as archivo:
+            estadisticas[producto].to_csv(archivo, index = False, float_format = "%.3f")
+        archivos.append(ruta)
+    return archivos
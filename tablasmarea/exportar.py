@@ -0,0 +1,145 @@
+'''
+=== EXPORTACIÓN DE LAS TABLAS A CSV, JSON Y HTML ===
+
+Genera formatos fáciles de leer por otros programas directamente a partir de
+los datos de cada mes, sin pasar por el texto de ancho fijo ni por el PDF:
+- CSV y JSON -> las alturas se calculan de los registros del .LIS (ya sin el
+  BMI) y se redondean a 3 decimales; los textos de las tablas están recortados
+  a 5 caracteres (por ejemplo, -0.107 m aparece como "-0.10"), por lo que no
+  se usan como valores.
+- HTML -> es una página para leerse, por lo que usa exactamente los mismos
+  textos que aparecen en las tablas impresas.
+
+Cada formato es una función que recibe las tablas de una estación y regresa,
+uno por uno, los fragmentos de texto del archivo, por lo que se pueden
+escribir conforme se generan (con "escribir_paginas") en un archivo, en la
+salida estándar o en cualquier objeto con método "write".
+
+Se pueden agregar otros formatos con "registrar_formato". Los archivos de
+estos formatos se escriben en UTF-8.
+'''
+
+import html
+import json
+
+import numpy as np
+
+from tablasmarea.maquetado import COLUMNAS, EVENTOS_DIA, METROS_A_PIES, SIN_DATO, dias_mes, dictMeses, formato_horas
+from tablasmarea.texto import FILA_MERIDIANO
+
+
+# Columnas de los archivos CSV.
+COLUMNAS_CSV = ["ESTACION", "YEAR", "MES", "DIA", "HORA", "PIES", "METROS"]
+
+# Decimales de las alturas en PIES y METROS de los archivos CSV y JSON.
+DECIMALES = 3
+
+
+# --- FUNCIÓN PARA OBTENER LOS EVENTOS DE LA CUADRÍCULA DE UN MES ---
+# Recibe la cuadrícula de 55 filas x 12 columnas que regresa "maquetar_mes".
+# Regresa cuatro arreglos con el día, la hora, las alturas en PIES y en METROS (como texto) de cada evento,
+# en orden de día y hora.
+def eventos_tabla(tabla):
+    # Las columnas HORA de los tres bloques DIA/HORA/PIES/METROS son la 1, 5 y 9.
+    columnasHora = np.arange(1, len(COLUMNAS), 4)
+    filas, bloques = np.nonzero(tabla[:, columnasHora] != " ")
+    # Los días 1 a 30 ocupan 5 filas en su bloque; el día 31 ocupa las filas 50 a 54 del tercero.
+    dias = np.where(filas < FILA_MERIDIANO, filas // EVENTOS_DIA + 10 * bloques + 1, 31)
+
+    orden = np.lexsort((filas, dias))
+    filas, columnas, dias = filas[orden], columnasHora[bloques[orden]], dias[orden]
+    return dias, tabla[filas, columnas], tabla[filas, columnas + 1], tabla[filas, columnas + 2]
+
+
+# --- FUNCIÓN PARA OBTENER LOS EVENTOS DE UN MES CON SUS ALTURAS SIN RECORTAR ---
+# Recibe tres parámetros:
+# 1. resultado -> tablas de la estación que regresa "generar_tablas".
+# 2. year, mes -> año y mes de la tabla.
+# Regresa cuatro arreglos con el día, la hora (texto HHMM) y las alturas en PIES y en METROS...
+# (números redondeados a "DECIMALES") de cada evento, en orden de día y hora. Si el resultado no trae...
+# los registros de cada mes, las alturas se toman de los textos de la tabla.
+def eventos_mes(resultado, year, mes):
+    if resultado.registros is None:
+        dias, horas, pies, metros = eventos_tabla(resultado.tablas[(year, mes)])
+        return dias, horas, pies.astype(np.float64), metros.astype(np.float64)
+
+    # Se descartan, igual que en la tabla, los eventos vacíos y los días fuera del mes.
+    fecha, tiempos, alturas = resultado.registros[(year, mes)]
+    dias = np.repeat(np.asarray(fecha) % 100, EVENTOS_DIA).reshape(-1, EVENTOS_DIA)
+    tiempos = np.asarray(tiempos)
+    conDato = (tiempos != SIN_DATO) & (dias >= 1) & (dias <= dias_mes(mes, year))
+    metros = np.asarray(alturas, dtype = np.float64)[conDato] / 100
+    # Al sumar 0.0 se evita escribir "-0.000" cuando una altura negativa se redondea a cero.
+    return (dias[conDato], formato_horas(tiempos[conDato]),
+            np.round(metros * METROS_A_PIES, DECIMALES) + 0.0, np.round(metros, DECIMALES) + 0.0)
+
+
+# --- FUNCIÓN PARA EXPORTAR A CSV ---
+# Recibe las tablas de la estación que regresa "generar_tablas" y regresa un fragmento de texto por mes.
+def renderizar_csv(resultado):
+    yield ",".join(COLUMNAS_CSV) + "\n"
+    numero = resultado.estacion.numero
+    for year, mes in resultado.tablas:
+        dias, horas, pies, metros = eventos_mes(resultado, year, mes)
+        yield "".join(["{},{},{},{},{},{:.{d}f},{:.{d}f}\n".format(numero, year, mes, dia, hora, alturaPies, alturaMetros,
+                                                                    d = DECIMALES)
+                       for dia, hora, alturaPies, alturaMetros in zip(dias, horas, pies, metros)])
+
+
+# --- FUNCIÓN PARA EXPORTAR A JSON ---
+# Recibe las tablas de la estación que regresa "generar_tablas" y regresa un fragmento de texto por mes.
+# El documento tiene los datos de la estación y una lista de meses, cada uno con sus eventos.
+def renderizar_json(resultado):
+    estacion = resultado.estacion
+    yield '{"estacion": ' + json.dumps({"numero": estacion.numero, "nombre": estacion.nombre,
+                                        "meridiano": estacion.meridiano, "bmi": estacion.bmi},
+                                       ensure_ascii = False) + ', "meses": ['
+    separador = "\n"
+    for year, mes in resultado.tablas:
+        dias, horas, pies, metros = eventos_mes(resultado, year, mes)
+        eventos = [{"dia": int(dia), "hora": str(hora), "pies": float(alturaPies), "metros": float(alturaMetros)}
+                   for dia, hora, alturaPies, alturaMetros in zip(dias, horas, pies, metros)]
+        yield separador + json.dumps({"year": year, "mes": mes, "nombre": dictMeses[mes][0], "eventos": eventos},
+                                     ensure_ascii = False)
+        separador = ",\n"
+    yield "\n]}\n"
+
+
+# --- FUNCIÓN PARA EXPORTAR A UNA PÁGINA HTML ---
+# Recibe las tablas de la estación que regresa "generar_tablas" y regresa un fragmento de texto por mes.
+# Cada mes es una tabla con las columnas DIA, HORA, PIES y METROS; el día se escribe solo en su primer evento.
+# Las horas y alturas son los mismos textos de las tablas impresas.
+def renderizar_html(resultado):
+    estacion = resultado.estacion
+    nombre = html.escape(estacion.nombre)
+    yield ("<!DOCTYPE html>\n<html lang=\"es\">\n<head>\n<meta charset=\"utf-8\">\n"
+           "<title>Tablas de marea - " + nombre + "</title>\n"
+           "<style>body{font-family:sans-serif} table{border-collapse:collapse;margin-bottom:2em}"
+           " td,th{padding:0 .6em;text-align:right}</style>\n</head>\n<body>\n"
+           "<h1>ESTACION " + nombre + "</h1>\n"
+           "<p>HORA DEL MERIDIANO {:03d}&deg; W.</p>\n".format(int(estacion.meridiano)))
+    for (year, mes), tabla in resultado.tablas.items():
+        dias, horas, pies, metros = eventos_tabla(tabla)
+        primero = np.concatenate(([True], dias[1:] != dias[:-1]))
+        filas = ["<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>".format(dia if nuevo else "", hora, alturaPies, alturaMetros)
+                 for dia, nuevo, hora, alturaPies, alturaMetros in zip(dias, primero, horas, pies, metros)]
+        yield ("<h2>{} {}</h2>\n<table>\n<tr><th>DIA</th><th>HORA</th><th>PIES</th><th>METROS</th></tr>\n".format(dictMeses[mes][0], year)
+               + "\n".join(filas) + "\n</table>\n")
+    yield "</body>\n</html>\n"
+
+
+# Formatos disponibles: {nombre del formato (y extensión del archivo): función que lo genera}.
+RENDERIZADORES = {"csv": renderizar_csv, "json": renderizar_json, "html": renderizar_html}
+
+
+# --- FUNCIÓN PARA AGREGAR UN FORMATO DE EXPORTACIÓN ---
+# Recibe dos parámetros:
+# 1. nombre -> nombre del formato; también es la extensión del archivo.
+# 2. funcion -> función que recibe las tablas de una estación y regresa los fragmentos de texto del archivo.
+# El registro solo vale en el proceso actual: los procesos del lote o del servidor que se inician con...
+# "spawn" (Windows y macOS) importan de nuevo este módulo y no ven los formatos registrados dentro...
+# de "if __name__ == '__main__'" ("guardar_tablas" los reporta como formatos desconocidos). Para...
+# usarlos en esos procesos, se registran en el nivel superior del programa principal o de un módulo...
+# que este importe, que los procesos vuelven a ejecutar al iniciar.
+def registrar_formato(nombre, funcion):
+    RENDERIZADORES[nombre] = funcion
@@ -0,0 +1,293 @@
+'''
+=== GENERACIÓN DE LAS TABLAS DE MAREA DE UNA ESTACIÓN ===
+
+Reúne los pasos del programa de Tablas de Marea (lectura de los datos de las
+estaciones y del archivo .LIS, resta del BMI, maquetado de los meses y
+exportación a TXT y PDF) en funciones que pueden llamarse para cualquier
+archivo .LIS.
+
+Los meses se ubican a partir de la columna DATE, por lo que un mismo archivo
+puede cubrir varios años y se puede pedir cualquier rango de meses.
+
+"generar_tablas" regresa los resultados en memoria sin escribir archivos;
+"generar_estacion" además los guarda en disco.
+'''
+
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from tablasmarea.estaciones import cargar_estaciones
+from tablasmarea.exportar import RENDERIZADORES
+from tablasmarea.cache_lis import cargar_lis
+from tablasmarea.lis import DatosLIS
+from tablasmarea.maquetado import claves_meses, maquetar_mes, ubicar_meses
+from tablasmarea.perfil import anotar, etapa, medir_estacion
+from tablasmarea.salida import escribir_bytes, escribir_paginas
+from tablasmarea.texto import texto_mes
+
+
+# --- FUNCIÓN PARA DEDUCIR EL AÑO DE LOS DATOS A PARTIR DE LA COLUMNA "DATE" ---
+# Recibe un parámetro:
+# 1. datos -> contenedor "DatosLIS" con los registros del archivo .LIS.
+# Solo es posible cuando la columna "DATE" trae la fecha completa (AAAAMMDD); en ese caso...
+# regresa el año con más registros. Si "DATE" solo trae el día del mes, regresa None.
+def inferir_year(datos):
+    if datos.fecha.max() <= 31:
+        return None
+    return int(np.bincount(datos.fecha // 10000).argmax())
+
+
+# Resultado de "generar_tablas":
+# estacion -> datos de la estación (nombre, meridiano y BMI).
+# year -> año del primer mes completo de los datos.
+# tablas -> diccionario {(año, mes): cuadrícula de 55 x 12 que regresa "maquetar_mes"}, en orden cronológico.
+# paginas -> lista con el texto de cada mes, o None si no se pidió el formato "txt".
+# pdf -> contenido del PDF en bytes, o None si no se pidió el formato "pdf".
+# estadisticas -> diccionario {producto: DataFrame} de "calcular_estadisticas", o None si no se pidió...
+#    el formato "estadisticas".
+# registros -> diccionario {(año, mes): (fecha, tiempos, alturas)} con los registros de cada mes...
+#    (alturas en centímetros, ya sin el BMI), para exportar los valores sin recortar; puede ser None.
+TablasEstacion = namedtuple("TablasEstacion", ["estacion", "year", "tablas", "paginas", "pdf", "estadisticas",
+                                               "registros"],
+                            defaults = (None, None))
+
+
+# Formatos que escribe "guardar_tablas" además de los de exportación ("RENDERIZADORES").
+FORMATOS_TABLAS = ("txt", "pdf", "estadisticas")
+
+
+# --- FUNCIÓN PARA COMPROBAR LOS NOMBRES DE LOS FORMATOS ---
+# Recibe los formatos que se escriben. Si alguno no es "txt", "pdf", "estadisticas" ni un formato de...
+# exportación registrado en este proceso, lanza ValueError en lugar de omitirlo sin avisar.
+def validar_formatos(formatos):
+    desconocidos = [formato for formato in formatos if formato not in FORMATOS_TABLAS and formato not in RENDERIZADORES]
+    if desconocidos:
+        raise ValueError("Formatos desconocidos: {}. Los formatos disponibles son: {}.".format(
+            ", ".join(desconocidos), ", ".join(list(FORMATOS_TABLAS) + list(RENDERIZADORES))))
+
+
+# --- FUNCIÓN PARA OBTENER LOS FORMATOS QUE SE CALCULAN ANTES DE ESCRIBIR LOS ARCHIVOS ---
+# Recibe los formatos que se escriben. Los textos y el PDF se arman a partir de las tablas al momento...
+# de escribirlos; las estadísticas necesitan las alturas originales y se calculan junto con las tablas.
+def formatos_memoria(formatos):
+    return tuple([formato for formato in formatos if formato == "estadisticas"])
+
+
+# --- FUNCIÓN PARA LEER UN MES ESCRITO COMO "AAAA-MM" ---
+# Recibe un texto como "2023-07" y regresa la tupla (2023, 7).
+def leer_mes(texto):
+    year, mes = texto.split("-")
+    if not 1 <= int(mes) <= 12:
+        raise ValueError("Mes fuera de rango: " + texto)
+    return int(year), int(mes)
+
+
+# Datos de una estación ya preparados para maquetar sus meses:
+# estacion -> datos de la estación (nombre, meridiano y BMI).
+# year -> año del primer mes completo de los datos.
+# fecha, tiempos, alturas -> columnas "DATE", "TIME" y "HGT" (ya sin el BMI) del archivo .LIS.
+# claves -> clave "año * 12 + mes - 1" del mes de cada registro, que regresa "claves_meses".
+# meses -> lista de tuplas (año, mes, primer registro, último registro sin incluirlo) de los meses a generar.
+DatosEstacion = namedtuple("DatosEstacion", ["estacion", "year", "fecha", "tiempos", "alturas", "claves", "meses"])
+
+
+# --- FUNCIÓN PARA PREPARAR LOS DATOS DE UNA ESTACIÓN ---
+# Recibe los mismos parámetros que "generar_tablas", salvo "formatos".
+# Lee el archivo .LIS (o su caché binario), busca la estación, resta el BMI y ubica los registros de cada mes del rango.
+# Regresa un contenedor "DatosEstacion".
+def preparar_datos(archivoDatos, year = None, estaciones = None, directorioDatos = ".", desde = None, hasta = None):
+    # Los datos del .LIS se toman del caché binario si el archivo no ha cambiado desde la última lectura.
+    with etapa("lectura"):
+        datos = cargar_lis(archivoDatos)
+
+    # Origen de los datos para los mensajes de error.
+    if isinstance(archivoDatos, DatosLIS):
+        origen = "los registros de la estación {}".format(int(datos.estacion[0]))
+    else:
+        origen = "el archivo " + str(archivoDatos)
+
+    # Año y mes del primer mes completo de los datos: enero de "year" o, si no se indica el año y...
+    # no se puede deducir de la columna DATE, el mes "desde".
+    mes = 1
+    if year is None:
+        year = inferir_year(datos)
+        if year is None and desde is not None:
+            year, mes = desde
+        if year is None:
+            raise ValueError("No se pudo deducir el año de la columna DATE de " + origen + "; indíquelo con --year o --desde.")
+    if desde is None:
+        desde = (year, 1)
+    if hasta is None:
+        hasta = (desde[0], 12)
+
+    # Busca los datos de la estación en el registro de "ESTACIONES.txt" y "NBMI.txt".
+    if estaciones is None:
+        with etapa("estaciones"):
+            estaciones = cargar_estaciones(directorioDatos)
+    anotar("estacion", int(datos.estacion[0]))
+    if int(datos.estacion[0]) not in estaciones:
+        raise ValueError("La estación {} no aparece en ESTACIONES.txt o NBMI.txt.".format(datos.estacion[0]))
+    estacion = estaciones[int(datos.estacion[0])]
+
+    # Restamos el BMI (promedio de bajamar) de la estación a las alturas.
+    with etapa("bmi"):
+        alturas = datos.alturas - estacion.bmi
+
+    # Ubicamos los registros de cada mes a partir de la columna "DATE"; los días de meses incompletos...
+    # al inicio y al final del archivo (por ejemplo, el 31 de diciembre del año anterior) quedan fuera del rango.
+    with etapa("meses"):
+        try:
+            claves = claves_meses(datos.fecha, year, mes, datos.hl)
+        except ValueError as error:
+            raise ValueError("En {}: {}".format(origen, error))
+        meses = ubicar_meses(claves, desde, hasta)
+    if not meses:
+        raise ValueError("En {} no hay datos entre {}-{:02d} y {}-{:02d}.".format(origen, *desde, *hasta))
+
+    return DatosEstacion(estacion, year, datos.fecha, datos.tiempos, alturas, claves, meses)
+
+
+# --- FUNCIÓN PARA GENERAR EN MEMORIA LAS TABLAS DE UNA ESTACIÓN ---
+# Recibe siete parámetros:
+# 1. archivoDatos -> ruta del archivo .LIS con los datos de la predicción para la estación, o un contenedor...
+#    "DatosLIS" con sus registros (por ejemplo, uno de los que regresa "leer_bloques_lis").
+# 2. year -> año del primer mes completo de los datos; si es None se deduce de la columna "DATE" o, si...
+#    esta solo trae el día, el primer mes completo de los datos es "desde".
+# 3. estaciones -> registro de estaciones que regresa "cargar_estaciones"; si es None...
+#    se carga el de "directorioDatos".
+# 4. formatos -> formatos que se generan además de las tablas: "txt", "pdf" y/o "estadisticas".
+# 5. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# 6. desde -> tupla (año, mes) del primer mes que se genera; si es None, enero de "year".
+# 7. hasta -> tupla (año, mes) del último mes que se genera; si es None, diciembre del año de "desde".
+# Solo se generan los meses del rango que aparecen en el archivo .LIS.
+# No escribe ni borra archivos. La librería fpdf solo se importa si se pide el formato "pdf".
+def generar_tablas(archivoDatos, year = None, estaciones = None, formatos = ("txt", "pdf"), directorioDatos = ".",
+                   desde = None, hasta = None):
+    datos = preparar_datos(archivoDatos, year, estaciones, directorioDatos, desde, hasta)
+    estacion = datos.estacion
+
+    # Acomodamos los datos de cada mes en su tabla.
+    tablas = {}
+    registros = {}
+    for yearMes, mes, i0, i1 in datos.meses:
+        registros[(yearMes, mes)] = (datos.fecha[i0:i1], datos.tiempos[i0:i1], datos.alturas[i0:i1])
+        with etapa("maquetado {}-{:02d}".format(yearMes, mes)):
+            tablas[(yearMes, mes)] = maquetar_mes(*registros[(yearMes, mes)], mes, yearMes)
+
+    # Obtenemos los textos de los meses con el formato del archivo TXT.
+    paginas = None
+    if "txt" in formatos:
+        paginas = list(paginas_texto(TablasEstacion(estacion, datos.year, tablas, None, None)))
+
+    resultado = TablasEstacion(estacion, datos.year, tablas, paginas, None, registros = registros)
+
+    # Las estadísticas se calculan con las mismas alturas ya sin el BMI, sin volver a leer el archivo.
+    if "estadisticas" in formatos:
+        resultado = resultado._replace(estadisticas = estadisticas_datos(datos))
+
+    # El PDF se dibuja directamente a partir de las tablas de cada mes.
+    if "pdf" in formatos:
+        from tablasmarea.pdf import pdf_estacion
+        with etapa("pdf"):
+            resultado = resultado._replace(pdf = pdf_estacion(resultado, os.path.join(directorioDatos, "unam_logo.png")))
+
+    return resultado
+
+
+# --- FUNCIÓN PARA CALCULAR LAS ESTADÍSTICAS DE UNA ESTACIÓN ---
+# Recibe un parámetro:
+# 1. datos -> contenedor "DatosEstacion" que regresa "preparar_datos".
+# El módulo "estadisticas" (y Pandas) solo se importa si se piden las estadísticas.
+def estadisticas_datos(datos):
+    from tablasmarea.estadisticas import calcular_estadisticas, tabla_eventos
+    with etapa("estadisticas"):
+        return calcular_estadisticas(tabla_eventos(datos))
+
+
+# --- FUNCIÓN QUE GENERA UNA POR UNA LAS PÁGINAS DE TEXTO DE UNA ESTACIÓN ---
+# Recibe un parámetro:
+# 1. resultado -> tablas de la estación que regresa "generar_tablas".
+# Si el resultado ya trae las páginas, las regresa; si no, arma cada página hasta que se necesita.
+def paginas_texto(resultado):
+    if resultado.paginas is not None:
+        yield from resultado.paginas
+        return
+    for (year, mes), tabla in resultado.tablas.items():
+        with etapa("texto {}-{:02d}".format(year, mes)):
+            pagina = texto_mes(tabla, resultado.estacion.nombre, resultado.estacion.meridiano, mes, year)
+        yield pagina
+
+
+# --- FUNCIÓN PARA GUARDAR EN ARCHIVOS LAS TABLAS DE UNA ESTACIÓN ---
+# Recibe cinco parámetros:
+# 1. resultado -> tablas de la estación que regresa "generar_tablas".
+# 2. archivoDatos -> ruta del archivo .LIS del que se obtuvieron las tablas.
+# 3. directorioSalida -> carpeta donde se guardan los archivos, con el nombre del archivo .LIS.
+# 4. formatos -> formatos que se escriben: "txt", "pdf", "estadisticas" (un CSV por producto)...
+#    y los de exportación del módulo "exportar" ("csv", "json" y "html").
+# 5. directorioDatos -> carpeta con "unam_logo.png", por si el PDF no viene ya generado.
+# Cada archivo se escribe en un temporal que reemplaza al anterior solo cuando está completo.
+# Regresa la lista de rutas de los archivos generados.
+def guardar_tablas(resultado, archivoDatos, directorioSalida = ".", formatos = ("txt", "pdf"), directorioDatos = "."):
+    # archivoSalida -> obtenemos el nombre del archivo base de "archivoDatos" a partir de su ruta...
+    # y omitimos la extensión.
+    validar_formatos(formatos)
+    archivoSalida = os.path.join(directorioSalida, os.path.splitext(os.path.basename(archivoDatos))[0])
+    archivos = []
+
+    # Salvamos el texto de los meses en un archivo TXT, página por página.
+    if "txt" in formatos:
+        with etapa("escritura txt"):
+            escribir_paginas(paginas_texto(resultado), archivoSalida + ".txt")
+        archivos.append(archivoSalida + ".txt")
+
+    # Salvamos el PDF, dibujándolo a partir de las tablas si no viene ya generado.
+    if "pdf" in formatos:
+        contenidoPDF = resultado.pdf
+        if contenidoPDF is None:
+            from tablasmarea.pdf import pdf_estacion
+            with etapa("pdf"):
+                contenidoPDF = pdf_estacion(resultado, os.path.join(directorioDatos, "unam_logo.png"))
+        with etapa("escritura pdf"):
+            escribir_bytes(contenidoPDF, archivoSalida + ".pdf")
+        archivos.append(archivoSalida + ".pdf")
+
+    # Salvamos los formatos de exportación (CSV, JSON, HTML...), generados directamente a partir de las tablas.
+    # Se escriben en UTF-8, que es la codificación que declaran el HTML y el JSON; el TXT conserva la...
+    # codificación del sistema, como en el programa original.
+    for formato in formatos:
+        if formato in RENDERIZADORES:
+            with etapa("escritura " + formato):
+                escribir_paginas(RENDERIZADORES[formato](resultado), archivoSalida + "." + formato, "utf-8")
+            archivos.append(archivoSalida + "." + formato)
+
+    # Salvamos las estadísticas, que deben venir ya calculadas en el resultado.
+    if "estadisticas" in formatos:
+        if resultado.estadisticas is None:
+            raise ValueError("Las estadísticas no se calcularon; incluya \"estadisticas\" en los formatos de generar_tablas.")
+        from tablasmarea.estadisticas import escribir_estadisticas
+        with etapa("escritura estadisticas"):
+            archivos += escribir_estadisticas(resultado.estadisticas, archivoSalida)
+
+    return archivos
+
+
+# --- FUNCIÓN PARA GENERAR LOS ARCHIVOS TXT Y PDF DE UNA ESTACIÓN ---
+# Recibe siete parámetros:
+# 1. archivoDatos -> ruta del archivo .LIS con los datos de la predicción para la estación.
+# 2. year -> año del primer mes completo de los datos; si es None se deduce de la columna "DATE".
+# 3. directorioSalida -> carpeta donde se guardan los archivos, con el nombre del archivo .LIS.
+# 4. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# 5. formatos -> formatos que se escriben: "txt", "pdf", "estadisticas", "csv", "json" y/o "html".
+# 6. desde -> tupla (año, mes) del primer mes que se genera; si es None, enero de "year".
+# 7. hasta -> tupla (año, mes) del último mes que se genera; si es None, diciembre del año de "desde".
+# Regresa la lista de rutas de los archivos generados.
+def generar_estacion(archivoDatos, year = None, directorioSalida = ".", directorioDatos = ".", formatos = ("txt", "pdf"),
+                     desde = None, hasta = None):
+    # Solo se generan las tablas (y las estadísticas, si se piden); los textos y el PDF se arman...
+    # al momento de escribirlos.
+    with medir_estacion(archivoDatos):
+        resultado = generar_tablas(archivoDatos, year, None, formatos_memoria(formatos), directorioDatos, desde, hasta)
+        return guardar_tablas(resultado, archivoDatos, directorioSalida, formatos, directorioDatos)
@@ -0,0 +1,137 @@
+'''
+=== REGENERACIÓN INCREMENTAL DE LAS TABLAS DE MAREA ===
+
+Cuando las predicciones del SPL64 se vuelven a calcular, normalmente solo
+cambian algunos meses. Junto a los archivos de salida de cada estación se
+guarda un manifiesto (".HL25023.manifiesto") con el hash de los registros de
+cada mes y de los datos de la estación, junto con la tabla y la página de
+texto ya generadas de cada mes.
+
+En la siguiente ejecución solo se maquetan y se escriben de nuevo los meses
+cuyo hash cambió; los demás se toman del manifiesto. Si ningún mes cambió y
+los archivos de salida existen, no se escribe nada.
+
+El PDF se vuelve a dibujar completo cuando cambia algún mes (fpdf no permite
+reemplazar páginas de un documento ya generado), pero a partir de las tablas
+guardadas, sin volver a maquetarlas.
+'''
+
+import hashlib
+import os
+import pickle
+
+from tablasmarea.generador import TablasEstacion, estadisticas_datos, guardar_tablas, preparar_datos
+from tablasmarea.maquetado import maquetar_mes
+from tablasmarea.perfil import etapa
+from tablasmarea.salida import escritura_atomica
+from tablasmarea.texto import texto_mes
+
+
+# Versión del formato del manifiesto; si cambia, los manifiestos anteriores se descartan.
+VERSION_MANIFIESTO = 1
+
+
+# --- FUNCIÓN PARA OBTENER LA RUTA DEL MANIFIESTO DE UNA ESTACIÓN ---
+# Recibe dos parámetros:
+# 1. archivoDatos -> ruta del archivo .LIS de la estación.
+# 2. directorioSalida -> carpeta donde se guardan los archivos de salida.
+def ruta_manifiesto(archivoDatos, directorioSalida = "."):
+    nombre = os.path.splitext(os.path.basename(archivoDatos))[0]
+    return os.path.join(directorioSalida, "." + nombre + ".manifiesto")
+
+
+# --- FUNCIÓN PARA OBTENER EL HASH DE LOS DATOS DE UNA ESTACIÓN ---
+# Recibe los datos de la estación (número, nombre, meridiano y BMI).
+def hash_estacion(estacion):
+    return hashlib.sha1(repr(tuple(estacion)).encode("utf-8")).hexdigest()
+
+
+# --- FUNCIÓN PARA OBTENER EL HASH DE LOS REGISTROS DE UN MES ---
+# Recibe cinco parámetros:
+# 1. fecha, tiempos, alturas -> columnas "DATE", "TIME" y "HGT" (ya sin el BMI) de los registros del mes.
+# 2. mes -> número de mes.
+# 3. year -> año del mes.
+def hash_mes(fecha, tiempos, alturas, mes, year):
+    resumen = hashlib.sha1("{}-{:02d}".format(year, mes).encode("utf-8"))
+    for columna in (fecha, tiempos, alturas):
+        resumen.update(columna.tobytes())
+    return resumen.hexdigest()
+
+
+# --- FUNCIÓN PARA LEER EL MANIFIESTO DE UNA ESTACIÓN ---
+# Regresa el contenido del manifiesto, o None si no existe, está dañado o es de otra versión.
+def leer_manifiesto(ruta):
+    try:
+        with open(ruta, "rb") as archivo:
+            manifiesto = pickle.load(archivo)
+    except Exception:
+        return None
+    if not isinstance(manifiesto, dict) or manifiesto.get("version") != VERSION_MANIFIESTO:
+        return None
+    return manifiesto
+
+
+# --- FUNCIÓN PARA GUARDAR EL MANIFIESTO DE UNA ESTACIÓN ---
+# Se escribe en un archivo temporal que luego reemplaza al anterior, igual que los archivos de salida.
+def guardar_manifiesto(ruta, manifiesto):
+    with escritura_atomica(ruta, "wb") as archivo:
+        pickle.dump(manifiesto, archivo, protocol = pickle.HIGHEST_PROTOCOL)
+
+
+# --- FUNCIÓN PARA GENERAR DE FORMA INCREMENTAL LOS ARCHIVOS DE UNA ESTACIÓN ---
+# Recibe los mismos parámetros que "generar_estacion".
+# Solo se maquetan y se escriben de nuevo los meses cuyos registros o datos de la estación cambiaron...
+# desde la ejecución anterior.
+# Regresa una tupla (tablas, archivos, cambios):
+# 1. tablas -> contenedor "TablasEstacion" con las tablas y páginas de todos los meses.
+# 2. archivos -> lista de rutas de los archivos escritos (vacía si no hubo cambios).
+# 3. cambios -> lista de tuplas (año, mes) de los meses que se volvieron a generar.
+def generar_incremental(archivoDatos, year = None, directorioSalida = ".", directorioDatos = ".",
+                        formatos = ("txt", "pdf"), desde = None, hasta = None):
+    datos = preparar_datos(archivoDatos, year, None, directorioDatos, desde, hasta)
+    estacion = datos.estacion
+    ruta = ruta_manifiesto(archivoDatos, directorioSalida)
+
+    # Los meses guardados solo se reutilizan si los datos de la estación no cambiaron.
+    manifiesto = leer_manifiesto(ruta)
+    hashEstacion = hash_estacion(estacion)
+    anteriores = {}
+    if manifiesto is not None and manifiesto["estacion"] == hashEstacion:
+        anteriores = manifiesto["meses"]
+
+    meses = {}
+    cambios = []
+    for yearMes, mes, i0, i1 in datos.meses:
+        clave = (yearMes, mes)
+        hashMes = hash_mes(datos.fecha[i0:i1], datos.tiempos[i0:i1], datos.alturas[i0:i1], mes, yearMes)
+        if clave in anteriores and anteriores[clave][0] == hashMes:
+            meses[clave] = anteriores[clave]
+            continue
+        with etapa("maquetado {}-{:02d}".format(yearMes, mes)):
+            tabla = maquetar_mes(datos.fecha[i0:i1], datos.tiempos[i0:i1], datos.alturas[i0:i1], mes, yearMes)
+        with etapa("texto {}-{:02d}".format(yearMes, mes)):
+            pagina = texto_mes(tabla, estacion.nombre, estacion.meridiano, mes, yearMes)
+        meses[clave] = (hashMes, tabla, pagina)
+        cambios.append(clave)
+
+    resultado = TablasEstacion(estacion, datos.year,
+                               {clave: mes[1] for clave, mes in meses.items()},
+                               [mes[2] for mes in meses.values()], None,
+                               registros = {(yearMes, mes): (datos.fecha[i0:i1], datos.tiempos[i0:i1], datos.alturas[i0:i1])
+                                            for yearMes, mes, i0, i1 in datos.meses})
+
+    # Si no cambió ningún mes (ni se quitó alguno) y ya existen los archivos de salida, no se escribe nada.
+    archivoSalida = os.path.join(directorioSalida, os.path.splitext(os.path.basename(archivoDatos))[0])
+    # De las estadísticas se revisa el último archivo que se escribe ("anual").
+    extensiones = [".anual.csv" if formato == "estadisticas" else "." + formato for formato in formatos]
+    existentes = all(os.path.exists(archivoSalida + extension) for extension in extensiones)
+    if not cambios and list(meses) == list(anteriores) and existentes:
+        return resultado, [], []
+
+    # Las estadísticas se calculan de nuevo completas, con los datos ya leídos.
+    if "estadisticas" in formatos:
+        resultado = resultado._replace(estadisticas = estadisticas_datos(datos))
+
+    archivos = guardar_tablas(resultado, archivoDatos, directorioSalida, formatos, directorioDatos)
+    guardar_manifiesto(ruta, {"version": VERSION_MANIFIESTO, "estacion": hashEstacion, "meses": meses})
+    return resultado, archivos, cambios
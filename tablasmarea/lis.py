@@ -0,0 +1,109 @@
+'''
+=== LECTURA DE ARCHIVOS .LIS DEL PROGRAMA SPL64 ===
+
+Cada registro de un archivo .LIS corresponde a un día y tiene las columnas:
+STN (número de estación), DATE (día del mes), HL, y cinco pares TIME/HGT
+(hora en formato HHMM y altura en centímetros). Los pares sin dato tienen
+el valor 9999.
+
+La primera línea del archivo es el encabezado; sus nombres no se usan porque
+no siempre coinciden con la posición de los datos.
+
+Los archivos con las predicciones de varias estaciones (la salida de SPL64 de
+cada estación, una tras otra, con o sin su encabezado) se leen por bloques de
+tamaño fijo con "leer_bloques_lis", que regresa los registros de una estación
+a la vez sin cargar todo el archivo en memoria.
+'''
+
+import io
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+# Nombres explícitos de las 13 columnas de un registro .LIS. Los pares repetidos TIME/HGT...
+# llevan el mismo sufijo que Pandas les asignaba al leer el encabezado original.
+COLUMNAS_LIS = ["STN", "DATE", "HL",
+                "TIME", "HGT", "TIME.1", "HGT.1", "TIME.2", "HGT.2", "TIME.3", "HGT.3", "TIME.4", "HGT.4"]
+
+# Contenedor con las columnas de un archivo .LIS:
+# estacion -> número de estación de cada registro (int32).
+# fecha -> valor de la columna DATE de cada registro (int32).
+# hl -> valor de la columna HL de cada registro (int32).
+# tiempos -> arreglo de N registros x 5 columnas con las horas (int16).
+# alturas -> arreglo de N registros x 5 columnas con las alturas en centímetros (int16).
+DatosLIS = namedtuple("DatosLIS", ["estacion", "fecha", "hl", "tiempos", "alturas"])
+
+# Tamaño, en bytes, de cada bloque que se lee de un archivo con varias estaciones.
+TAMANO_BLOQUE = 4 * 1024 * 1024
+
+# Líneas que no son registros (encabezados de cada estación): las que empiezan con una letra.
+LINEAS_TEXTO = re.compile(rb"^[ \t]*[A-Za-z][^\n]*\n?", re.MULTILINE)
+
+
+# --- FUNCIÓN PARA LEER UN ARCHIVO .LIS ---
+# Recibe un parámetro:
+# 1. archivo -> ruta o archivo abierto con los datos de la predicción.
+# Usa el motor "c" de Pandas (el separador "\s+" no obliga a usar el motor "python")...
+# y lee todos los valores directamente como enteros.
+def leer_lis(archivo):
+    valores = pd.read_csv(archivo, sep=r"\s+", header=None, skiprows=1,
+                          dtype=np.int32, engine="c").to_numpy()
+    return separar_columnas(valores)
+
+
+# --- FUNCIÓN PARA SEPARAR LAS COLUMNAS DE LOS REGISTROS .LIS ---
+# Recibe un parámetro:
+# 1. valores -> arreglo de enteros con un registro .LIS por fila.
+# Si los registros traen una columna extra al inicio, se descarta, igual que cuando...
+# Pandas la usaba como índice y se eliminaba con "reset_index".
+def separar_columnas(valores):
+    valores = valores[:, -len(COLUMNAS_LIS):]
+    return DatosLIS(estacion = np.ascontiguousarray(valores[:, 0]),
+                    fecha = np.ascontiguousarray(valores[:, 1]),
+                    hl = np.ascontiguousarray(valores[:, 2]),
+                    tiempos = valores[:, 3::2].astype(np.int16),
+                    alturas = valores[:, 4::2].astype(np.int16))
+
+
+# --- FUNCIÓN PARA LEER POR ESTACIONES UN ARCHIVO .LIS CON VARIAS ESTACIONES ---
+# Recibe dos parámetros:
+# 1. archivo -> ruta o archivo abierto en modo binario con los registros de una o varias estaciones.
+# 2. tamanoBloque -> número de bytes que se leen a la vez.
+# Regresa, uno por uno, un contenedor "DatosLIS" por cada grupo de registros consecutivos de la misma...
+# estación (columna STN). En memoria solo se tienen el bloque que se está leyendo y los registros...
+# de la estación en curso; los encabezados de cada estación se descartan.
+def leer_bloques_lis(archivo, tamanoBloque = TAMANO_BLOQUE):
+    if not hasattr(archivo, "read"):
+        with open(archivo, "rb") as abierto:
+            yield from leer_bloques_lis(abierto, tamanoBloque)
+        return
+
+    resto = b""
+    pendientes = []
+    while True:
+        bloque = archivo.read(tamanoBloque)
+        # Solo se procesan líneas completas; la última línea incompleta pasa al siguiente bloque.
+        texto = resto + bloque
+        corte = texto.rfind(b"\n") + 1 if bloque else len(texto)
+        texto, resto = LINEAS_TEXTO.sub(b"", texto[:corte]), texto[corte:]
+
+        if texto.strip():
+            valores = pd.read_csv(io.BytesIO(texto), sep=r"\s+", header=None,
+                                  dtype=np.int32, engine="c").to_numpy()
+            estaciones = valores[:, -len(COLUMNAS_LIS)]
+            # Se separan los registros donde cambia la estación; el primer grupo puede continuar...
+            # la estación del bloque anterior.
+            for grupo in np.split(valores, np.flatnonzero(np.diff(estaciones)) + 1):
+                if pendientes and pendientes[0][0, -len(COLUMNAS_LIS)] != grupo[0, -len(COLUMNAS_LIS)]:
+                    yield separar_columnas(np.concatenate(pendientes))
+                    pendientes = []
+                pendientes.append(grupo)
+
+        if not bloque:
+            break
+
+    if pendientes:
+        yield separar_columnas(np.concatenate(pendientes))
@@ -0,0 +1,233 @@
+'''
+=== GENERACIÓN DE TABLAS DE MAREA EN LOTE ===
+
+Procesa varios archivos .LIS (una carpeta o un patrón como "datos/*.LIS")
+sin pedir datos al usuario, repartiendo las estaciones entre varios procesos.
+
+Uso:
+~~~
+python -m tablasmarea.lote datos/ --year 2023 --salida tablas/
+~~~
+
+Si no se indica "--year", el año se deduce de la columna DATE de cada archivo.
+Con "--desde" y "--hasta" (AAAA-MM) se puede generar cualquier rango de meses,
+incluso de varios años, de archivos con predicciones largas:
+~~~
+python -m tablasmarea.lote datos/ --year 2020 --desde 2020-01 --hasta 2029-12
+~~~
+
+Con "--incremental" solo se vuelven a generar los meses que cambiaron desde la
+ejecución anterior (ver el módulo "incremental"). Con "--perfil registros.jsonl"
+se agrega a ese archivo un registro JSON por estación con el tiempo y la
+memoria de cada etapa (ver el módulo "perfil").
+
+Con "--multiestacion" cada entrada es un archivo con los registros de varias
+estaciones, uno tras otro; el archivo se lee por bloques y las tablas de cada
+estación se generan en cuanto se terminan de leer sus registros, sin cargar
+todo el archivo en memoria ni separarlo antes. Si una estación aparece en
+varios bloques separados, cada aparición se guarda con un sufijo ("HL<estación>_2")
+y se indica en el resumen:
+~~~
+python -m tablasmarea.lote predicciones.LIS --multiestacion --year 2023 --salida tablas/
+~~~
+'''
+
+import argparse
+import glob
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from tablasmarea.generador import formatos_memoria, generar_tablas, guardar_tablas, leer_mes, validar_formatos
+from tablasmarea.incremental import generar_incremental
+from tablasmarea.lis import leer_bloques_lis
+from tablasmarea.perfil import VARIABLE_PERFIL, medir_estacion
+from tablasmarea.salida import escribir_bytes
+
+
+# --- FUNCIÓN PARA OBTENER LA LISTA DE ARCHIVOS .LIS ---
+# Recibe un parámetro:
+# 1. entradas -> lista de carpetas, archivos o patrones (glob).
+# Regresa las rutas de los archivos .LIS encontrados, ordenadas y sin repetir.
+def buscar_archivos(entradas):
+    archivos = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            archivos += [os.path.join(entrada, nombre) for nombre in os.listdir(entrada)
+                         if nombre.upper().endswith(".LIS")]
+        else:
+            archivos += glob.glob(entrada)
+    return sorted(set(archivos))
+
+
+# --- FUNCIÓN QUE OBTIENE LAS ESTACIONES DEL LOTE ---
+# Recibe dos parámetros:
+# 1. archivos -> lista de rutas de archivos .LIS.
+# 2. multiestacion -> si es True, cada archivo trae los registros de varias estaciones.
+# Regresa, una por una, tuplas (archivo, datos, aviso). Con "multiestacion", "archivo" es el nombre...
+# "HL<estación>.LIS" junto al archivo original (de él se toma el nombre de las salidas) y "datos"...
+# es el contenedor "DatosLIS" de la estación; si no, "datos" es None y el archivo se lee en cada proceso.
+# Si una estación vuelve a aparecer más adelante (en el mismo archivo o en otro), sus registros no...
+# se pueden unir a los que ya se enviaron, así que el nombre lleva el sufijo "_2", "_3", etc., para...
+# no sobrescribir las salidas anteriores; "aviso" lo explica (y es "" en otro caso).
+def _estaciones_lote(archivos, multiestacion):
+    apariciones = {}
+    for archivo in archivos:
+        if not multiestacion:
+            yield archivo, None, ""
+            continue
+        for datos in leer_bloques_lis(archivo):
+            estacion = int(datos.estacion[0])
+            apariciones[estacion] = apariciones.get(estacion, 0) + 1
+            if apariciones[estacion] == 1:
+                nombre, aviso = "HL{}.LIS".format(estacion), ""
+            else:
+                nombre = "HL{}_{}.LIS".format(estacion, apariciones[estacion])
+                aviso = " (la estación {} aparece de nuevo en {}; aparición {})".format(
+                    estacion, os.path.basename(archivo), apariciones[estacion])
+            yield os.path.join(os.path.dirname(archivo), nombre), datos, aviso
+
+
+# --- FUNCIÓN QUE EJECUTA CADA PROCESO DEL LOTE ---
+# Recibe los mismos parámetros que "generar_estacion", más "incremental", "devolverTablas" y "datosLIS"...
+# (registros ya leídos de la estación; si es None se lee "archivoDatos"), y en lugar de detener todo...
+# el lote cuando un archivo falla, regresa el error como texto.
+# Regresa una tupla (archivo, éxito, mensaje, tablas); "tablas" solo se regresa si "devolverTablas" es True.
+def _procesar(archivoDatos, year, directorioSalida, directorioDatos, formatos, desde = None, hasta = None,
+              incremental = False, devolverTablas = False, datosLIS = None):
+    try:
+        with medir_estacion(archivoDatos):
+            if incremental:
+                resultado, archivos, cambios = generar_incremental(archivoDatos, year, directorioSalida, directorioDatos,
+                                                                   formatos, desde, hasta)
+            else:
+                resultado = generar_tablas(archivoDatos if datosLIS is None else datosLIS, year, None,
+                                           formatos_memoria(formatos), directorioDatos, desde, hasta)
+                archivos = guardar_tablas(resultado, archivoDatos, directorioSalida, formatos, directorioDatos)
+    except Exception as error:
+        return archivoDatos, False, "{}: {}".format(type(error).__name__, error), None
+    mensaje = ", ".join([os.path.basename(archivo) for archivo in archivos])
+    if incremental:
+        mensaje = "{} meses regenerados{}".format(len(cambios), " (" + mensaje + ")" if archivos else ", sin cambios")
+    # Los textos y el PDF se escriben directamente en disco; solo se regresan las tablas.
+    return archivoDatos, True, mensaje, resultado if devolverTablas else None
+
+
+# --- FUNCIÓN PARA GENERAR LAS TABLAS DE VARIOS ARCHIVOS .LIS ---
+# Recibe once parámetros:
+# 1. archivos -> lista de rutas de archivos .LIS.
+# 2. year -> año de los datos; si es None se deduce de cada archivo.
+# 3. directorioSalida -> carpeta donde se guardan los TXT y PDF.
+# 4. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# 5. procesos -> número de procesos a usar (None usa todos los núcleos del equipo).
+# 6. formatos -> formatos que se escriben: "txt", "pdf", "estadisticas", "csv", "json" y/o "html".
+# 7. atlas -> ruta de un PDF donde se reúnen las tablas de todas las estaciones (None para no generarlo).
+# 8. desde -> tupla (año, mes) del primer mes que se genera; si es None, enero del año de los datos.
+# 9. hasta -> tupla (año, mes) del último mes que se genera; si es None, diciembre del año de "desde".
+# 10. incremental -> si es True, solo se vuelven a generar los meses que cambiaron desde la ejecución anterior.
+# 11. multiestacion -> si es True, cada archivo trae los registros de varias estaciones y se lee por bloques.
+# Regresa la lista de resultados (archivo, éxito, mensaje) en el mismo orden que "archivos" (y, con...
+# "multiestacion", que las estaciones dentro de cada archivo); el mensaje incluye el aviso de las...
+# estaciones repetidas. Un archivo cuyas salidas tendrían el mismo nombre que las de otro anterior...
+# (por ejemplo, "a/HL30001.LIS" y "b/HL30001.LIS") no se procesa y se regresa como error.
+def generar_lote(archivos, year = None, directorioSalida = ".", directorioDatos = ".", procesos = None,
+                 formatos = ("txt", "pdf"), atlas = None, desde = None, hasta = None,
+                 incremental = False, multiestacion = False):
+    if incremental and multiestacion:
+        raise ValueError("El modo incremental necesita un archivo .LIS por estación.")
+    os.makedirs(directorioSalida, exist_ok = True)
+    # Las estaciones se envían a los procesos conforme se leen, con a lo más dos tareas en espera...
+    # por proceso, para no acumular en memoria los registros de todo un archivo con varias estaciones.
+    limite = 2 * (procesos or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers = procesos) as ejecutor:
+        tareas = []
+        avisos = []
+        enEspera = set()
+        # salidas -> nombre base de las salidas (sin distinguir mayúsculas) y archivo que ya lo usa.
+        salidas = {}
+        for archivo, datosLIS, aviso in _estaciones_lote(archivos, multiestacion):
+            # Dos archivos con el mismo nombre en carpetas distintas escribirían las mismas salidas;...
+            # solo se procesa el primero y los demás se reportan como error.
+            nombre = os.path.splitext(os.path.basename(archivo))[0].upper()
+            if nombre in salidas:
+                tareas.append((archivo, False, "sus salidas tendrían el mismo nombre que las de {}; cambie el nombre "
+                                               "del archivo o procéselo con otra carpeta de salida".format(salidas[nombre]),
+                               None))
+                avisos.append(aviso)
+                continue
+            salidas[nombre] = archivo
+            if len(enEspera) >= limite:
+                enEspera = wait(enEspera, return_when = FIRST_COMPLETED).not_done
+            tarea = ejecutor.submit(_procesar, archivo, year, directorioSalida, directorioDatos, formatos, desde, hasta,
+                                    incremental, atlas is not None, datosLIS)
+            tareas.append(tarea)
+            avisos.append(aviso)
+            enEspera.add(tarea)
+        resultados = [tarea if isinstance(tarea, tuple) else tarea.result() for tarea in tareas]
+    resultados = [(archivo, exito, mensaje + aviso, tablas)
+                  for (archivo, exito, mensaje, tablas), aviso in zip(resultados, avisos)]
+
+    # El atlas se arma en un solo documento, con las estaciones en el mismo orden que "archivos".
+    if atlas is not None:
+        from tablasmarea.pdf import pdf_atlas
+        tablas = [resultado[3] for resultado in resultados if resultado[1]]
+        escribir_bytes(pdf_atlas(tablas, os.path.join(directorioDatos, "unam_logo.png")), atlas)
+
+    return [resultado[:3] for resultado in resultados]
+
+
+# --- FUNCIÓN PRINCIPAL DEL MODO EN LOTE ---
+# Recibe un parámetro:
+# 1. argv -> argumentos de la línea de comandos (None usa los de "sys.argv").
+# Regresa 0 si todos los archivos se procesaron correctamente y 1 en otro caso.
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Genera las tablas de marea de varios archivos .LIS.")
+    parser.add_argument("entradas", nargs = "+", help = "carpetas, archivos .LIS o patrones como 'datos/*.LIS'")
+    parser.add_argument("--year", type = int, default = None, help = "año de los datos (por omisión se deduce de la columna DATE)")
+    parser.add_argument("--salida", default = ".", help = "carpeta donde se guardan los TXT y PDF")
+    parser.add_argument("--datos", default = ".", help = "carpeta con ESTACIONES.txt, NBMI.txt y unam_logo.png")
+    parser.add_argument("--procesos", type = int, default = None, help = "número de procesos a usar")
+    parser.add_argument("--formatos", default = "txt,pdf", help = "formatos separados por comas (txt, pdf, estadisticas, csv, json, html)")
+    parser.add_argument("--desde", type = leer_mes, default = None, help = "primer mes a generar, como AAAA-MM (por omisión, enero)")
+    parser.add_argument("--hasta", type = leer_mes, default = None, help = "último mes a generar, como AAAA-MM (por omisión, diciembre)")
+    parser.add_argument("--incremental", action = "store_true", help = "solo vuelve a generar los meses que cambiaron")
+    parser.add_argument("--perfil", default = None, help = "archivo donde se agrega un registro JSON por estación con el tiempo y la memoria de cada etapa")
+    parser.add_argument("--atlas", default = None, help = "ruta de un PDF con las tablas de todas las estaciones")
+    parser.add_argument("--multiestacion", action = "store_true", help = "cada archivo trae los registros de varias estaciones, uno tras otro")
+    args = parser.parse_args(argv)
+
+    # Los procesos del lote heredan la variable de entorno que activa la medición de las etapas.
+    if args.perfil is not None:
+        os.environ[VARIABLE_PERFIL] = args.perfil
+
+    if args.incremental and args.multiestacion:
+        parser.error("--incremental no se puede usar con --multiestacion")
+
+    formatos = tuple(args.formatos.split(","))
+    try:
+        validar_formatos(formatos)
+    except ValueError as error:
+        parser.error(str(error))
+
+    archivos = buscar_archivos(args.entradas)
+    if not archivos:
+        parser.error("no se encontraron archivos .LIS")
+
+    resultados = generar_lote(archivos, args.year, args.salida, args.datos, args.procesos,
+                              formatos, args.atlas, args.desde, args.hasta,
+                              args.incremental, args.multiestacion)
+
+    # Resumen con el resultado de cada archivo (o de cada estación, con "--multiestacion").
+    errores = 0
+    for archivo, exito, mensaje in resultados:
+        print("{:<5} {} -> {}".format("OK" if exito else "ERROR", archivo, mensaje))
+        errores += not exito
+    print("{} {}, {} con error.".format(len(resultados), "estaciones procesadas" if args.multiestacion
+                                        else "archivos procesados", errores))
+    if args.atlas is not None:
+        print("Atlas: " + args.atlas)
+
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+'''
+=== MAQUETADO DE LAS TABLAS MENSUALES ===
+
+Acomoda las columnas TIME y HGT del archivo .LIS en la cuadrícula de 55 filas
+por 12 columnas (DIA, HORA, PIES, METROS por triplicado) de cada mes, usando
+operaciones con arreglos de NumPy en lugar de recorrer la tabla celda por celda.
+'''
+
+import calendar
+
+import numpy as np
+
+
+# Nombres de las columnas de la tabla mensual.
+COLUMNAS = ["DIA", "HORA", "PIES", "METROS", "DIA", "HORA", "PIES", "METROS", "DIA", "HORA", "PIES", "METROS"]
+
+# Número de filas de la tabla mensual: 10 días de 5 filas por columna, más 5 filas para el día 31.
+FILAS_TABLA = 55
+
+# Número de pares TIME/HGT que tiene cada fila del archivo .LIS.
+EVENTOS_DIA = 5
+
+# Valor con el que el archivo .LIS marca los datos vacíos.
+SIN_DATO = 9999
+
+# Factor para convertir METROS a PIES.
+METROS_A_PIES = 3.28084
+
+# Diccionario con los meses según su número. Los valores son:
+# 1. El nombre del mes.
+# 2. Los días que tiene el mes (febrero en un año que no es bisiesto).
+dictMeses = {1: ("ENERO", 31), 2: ("FEBRERO", 28), 3: ("MARZO", 31), 4: ("ABRIL", 30),
+             5: ("MAYO", 31), 6: ("JUNIO", 30), 7: ("JULIO", 31), 8: ("AGOSTO", 31),
+             9: ("SEPTIEMBRE", 30), 10: ("OCTUBRE", 31), 11: ("NOVIEMBRE", 30), 12: ("DICIEMBRE", 31)}
+
+
+# --- FUNCIÓN PARA OBTENER EL NÚMERO DE DÍAS DE UN MES ---
+# Recibe dos parámetros:
+# 1. mes -> número de mes.
+# 2. year -> para evaluar si el año es o no bisiesto.
+def dias_mes(mes, year):
+    return calendar.monthrange(year, mes)[1]
+
+
+# --- FUNCIÓN PARA ASIGNAR CADA REGISTRO DEL .LIS A SU MES ---
+# Recibe cuatro parámetros:
+# 1. fecha -> valores de la columna "DATE" de cada registro.
+# 2. year -> año del primer mes completo de los datos.
+# 3. mes -> número del primer mes completo de los datos (enero, si no se indica); solo se usa si...
+#    los registros no traen el mes.
+# 4. meses -> valores de la columna del mes de cada registro (la tercera columna de los .LIS de SPL64,...
+#    con el encabezado "HL"), o None si no se tiene.
+# Regresa, para cada registro, la clave "año * 12 + mes - 1" del mes al que pertenece.
+# - Si "DATE" trae la fecha completa (AAAAMMDD), se usa directamente.
+# - Si se tiene la columna del mes, cada registro se asigna al mes que indica; el primer grupo de...
+#   registros que comienza en el día 1 es el primer mes completo y es del año "year".
+# - Si solo se tiene el día, un mes nuevo comienza cada vez que el día es menor que el del registro...
+#   anterior, y el primer grupo es el mes "mes" de "year" o el final del mes anterior. Se usa la opción...
+#   en la que ningún grupo tiene días de más para su mes; si ninguna o ambas cumplen, no se adivina...
+#   y se lanza un ValueError.
+def claves_meses(fecha, year, mes = 1, meses = None):
+    fecha = np.asarray(fecha)
+    if fecha.max() > 31:
+        return (fecha // 10000) * 12 + (fecha // 100 % 100) - 1
+
+    # La columna del mes solo se usa si todos sus valores son meses y los días avanzan dentro de cada mes.
+    if meses is not None:
+        meses = np.asarray(meses)
+        cambio = meses[1:] != meses[:-1]
+        if meses.min() >= 1 and meses.max() <= 12 and np.all(cambio | (fecha[1:] > fecha[:-1])):
+            inicios = np.concatenate(([0], np.flatnonzero(cambio) + 1))
+            mesGrupo = meses[inicios].astype(np.int64)
+            # Un año nuevo comienza cuando el mes de un grupo no es mayor que el del grupo anterior.
+            yearGrupo = np.concatenate(([0], np.cumsum(mesGrupo[1:] <= mesGrupo[:-1])))
+            completos = np.flatnonzero(fecha[inicios] == 1)
+            ancla = completos[0] if len(completos) else 0
+            claveGrupo = (year - yearGrupo[ancla] + yearGrupo) * 12 + mesGrupo - 1
+            return np.repeat(claveGrupo, np.diff(np.concatenate((inicios, [len(fecha)]))))
+
+    cambio = fecha[1:] < fecha[:-1]
+    inicios = np.concatenate(([0], np.flatnonzero(cambio) + 1))
+    ultimoDia = np.maximum.reduceat(fecha, inicios)
+
+    # Opciones para el primer grupo: el mes "mes" (0) o el final del mes anterior (1). Si el primer...
+    # registro es el día 1, el primer grupo es un mes completo y solo puede ser el mes "mes".
+    candidatas = []
+    for base in ((0,) if fecha[0] == 1 else (0, 1)):
+        claveGrupo = year * 12 + mes - 1 + np.arange(len(inicios)) - base
+        diasGrupo = np.array([dias_mes(int(clave % 12 + 1), int(clave // 12)) for clave in claveGrupo])
+        if np.all(ultimoDia <= diasGrupo):
+            candidatas.append(claveGrupo)
+    if len(candidatas) != 1:
+        raise ValueError("No se pudo ubicar el primer mes de los datos a partir de la columna DATE; "
+                         "indique el primer mes completo con --desde AAAA-MM (sin --year).")
+    return np.repeat(candidatas[0], np.diff(np.concatenate((inicios, [len(fecha)]))))
+
+
+# --- FUNCIÓN PARA UBICAR LOS REGISTROS DE CADA MES DE UN RANGO ---
+# Recibe tres parámetros:
+# 1. claves -> claves de mes de cada registro que regresa "claves_meses" (en orden creciente).
+# 2. desde -> tupla (año, mes) del primer mes del rango.
+# 3. hasta -> tupla (año, mes) del último mes del rango.
+# Regresa una lista de tuplas (año, mes, primer registro, último registro sin incluirlo)...
+# con los meses del rango que tienen registros.
+def ubicar_meses(claves, desde, hasta):
+    inicio = desde[0] * 12 + desde[1] - 1
+    fin = hasta[0] * 12 + hasta[1] - 1
+    buscadas = np.arange(inicio, fin + 1)
+    # Con "searchsorted" se obtienen, en una sola operación, los límites de todos los meses.
+    primeros = np.searchsorted(claves, buscadas, side = "left")
+    ultimos = np.searchsorted(claves, buscadas, side = "right")
+    return [(int(clave // 12), int(clave % 12 + 1), int(primero), int(ultimo))
+            for clave, primero, ultimo in zip(buscadas, primeros, ultimos) if ultimo > primero]
+
+
+# --- FUNCIÓN PARA DAR FORMATO A LAS HORAS ---
+# Recibe un arreglo con las horas en formato HHMM y regresa sus textos con 4 dígitos.
+def formato_horas(tiempos):
+    return np.char.zfill(np.asarray(tiempos).astype(np.int64).astype(str), 4)
+
+
+# --- FUNCIÓN PARA DAR FORMATO A LAS ALTURAS ---
+# Recibe un arreglo con las alturas en centímetros y regresa dos arreglos de texto:
+# las alturas en PIES y en METROS, limitadas a 5 caracteres como máximo.
+def formato_alturas(alturas):
+    metros = np.asarray(alturas, dtype=np.float64) / 100
+    pies = metros * METROS_A_PIES
+    # "astype(str)" produce el mismo texto que "str()" y "astype('<U5')" lo recorta a 5 caracteres.
+    return pies.astype(str).astype("<U5"), metros.astype(str).astype("<U5")
+
+
+# --- FUNCIÓN PARA ACOMODAR LOS DATOS DE UN MES EN LA CUADRÍCULA DE LA TABLA ---
+# Recibe cinco parámetros:
+# 1. dias -> día del mes de cada registro del mes.
+# 2. tiempos -> arreglo de N registros x 5 columnas con las columnas "TIME" del mes.
+# 3. alturas -> arreglo de N registros x 5 columnas con las columnas "HGT" del mes (ya sin el BMI).
+# 4. mes -> número de mes.
+# 5. year -> año de los datos, para evaluar si el año es o no bisiesto.
+# Cada registro se coloca según su día, por lo que un día faltante solo deja su lugar vacío.
+# Regresa un arreglo de texto de 55 filas x 12 columnas; las celdas vacías tienen un espacio en blanco.
+def maquetar_mes(dias, tiempos, alturas, mes, year):
+    totalDias = dias_mes(mes, year)
+    tabla = np.full((FILAS_TABLA, len(COLUMNAS)), " ", dtype="<U6")
+
+    # Se colocan los números de los días, cada 5 filas.
+    numeros = np.arange(totalDias)
+    filasDia = np.where(numeros < 30, 5 * (numeros % 10), 50)
+    tabla[filasDia, 4 * np.minimum(numeros // 10, 2)] = (numeros + 1).astype(str)
+
+    # Posición de cada evento: "dia" es el día del mes (desde 0) repetido para sus 5 eventos.
+    dia = np.repeat(np.asarray(dias) % 100 - 1, EVENTOS_DIA)
+    evento = np.tile(np.arange(EVENTOS_DIA), len(dias))
+    horas = np.asarray(tiempos).reshape(-1)
+    # Se descartan los eventos marcados como vacíos (hora igual a 9999) y los días fuera del mes.
+    conDato = (horas != SIN_DATO) & (dia >= 0) & (dia < totalDias)
+    dia, evento, horas = dia[conDato], evento[conDato], horas[conDato]
+    pies, metros = formato_alturas(np.asarray(alturas).reshape(-1)[conDato])
+
+    # Los días 1 a 30 ocupan 5 filas cada uno en uno de los tres bloques; el día 31 va en las filas 50 a 54.
+    fila = np.where(dia < 30, 5 * (dia % 10), 50) + evento
+    columna = 4 * np.minimum(dia // 10, 2)
+    tabla[fila, columna + 1] = formato_horas(horas)
+    tabla[fila, columna + 2] = pies
+    tabla[fila, columna + 3] = metros
+
+    return tabla
@@ -0,0 +1,127 @@
+'''
+=== EXPORTACIÓN DE LAS TABLAS DE MAREA A PDF ===
+
+Dibuja cada página directamente a partir de la cuadrícula del mes: como la
+letra Courier tiene el mismo ancho para todos los caracteres, la posición de
+cada columna se calcula una sola vez y cada celda se escribe en su lugar, sin
+pasar por el texto de ancho fijo ni por "multi_cell".
+
+Un mismo documento puede reunir las páginas de varias estaciones (atlas); el
+logo se lee y se incrusta una sola vez por documento y se reutiliza en todas
+sus páginas.
+
+Este módulo es el único que usa la librería fpdf, por lo que solo se importa
+cuando se pide la salida en PDF.
+'''
+
+import numpy as np
+from fpdf import FPDF
+
+from tablasmarea.maquetado import COLUMNAS, EVENTOS_DIA, dictMeses
+from tablasmarea.texto import ANCHO_COLUMNA, ENCABEZADO, FILA_MERIDIANO, MARGEN, grupos_completos
+
+
+# Letra de las tablas y sus medidas en milímetros (1 punto = 25.4 / 72 mm).
+# En Courier todos los caracteres miden 600/1000 del tamaño de la letra.
+TAMANO_LETRA = 10.5
+ANCHO_CARACTER = 0.6 * TAMANO_LETRA * 25.4 / 72
+ALTO_LINEA = TAMANO_LETRA * 25.4 / 72
+
+# Número de líneas que caben en una página y línea donde va la cabecera con el nombre de la estación.
+LINEAS_PAGINA = 72
+LINEA_CABECERA = 9
+
+# Líneas de la página que ocupa la tabla: cabecera, línea en blanco, nombres de columnas, línea en blanco y 55 filas.
+LINEAS_TABLA = 4 + 55
+
+# Posición del borde derecho de cada columna, en caracteres desde el inicio de la línea de la tabla.
+DERECHA_COLUMNAS = np.arange(len(COLUMNAS)) * (ANCHO_COLUMNA + 1) + ANCHO_COLUMNA - MARGEN
+
+
+# --- FUNCIÓN PARA CREAR UN DOCUMENTO PDF VACÍO ---
+def nuevo_documento():
+    pdf = FPDF()
+    pdf.set_font("Courier", "B", TAMANO_LETRA)
+    # Las páginas se arman con posiciones fijas, por lo que no se necesita el salto de página automático.
+    pdf.set_auto_page_break(False)
+    return pdf
+
+
+# --- FUNCIÓN PARA AGREGAR LA PÁGINA DE UN MES A UN DOCUMENTO PDF ---
+# Recibe siete parámetros:
+# 1. pdf -> documento creado con "nuevo_documento".
+# 2. tabla -> cuadrícula de 55 filas x 12 columnas que regresa "maquetar_mes".
+# 3. estacion -> datos de la estación (nombre y meridiano).
+# 4. mes -> número de mes.
+# 5. year -> año al que corresponden los datos.
+# 6. logo -> ruta de la imagen que se coloca como fondo de la página.
+# 7. espaciar -> si es True, deja una línea en blanco después de los días con cinco eventos.
+def agregar_mes(pdf, tabla, estacion, mes, year, logo, espaciar = True):
+    pdf.add_page()
+    # fpdf guarda la imagen la primera vez que se usa su ruta y en las demás páginas solo la referencia.
+    pdf.image(logo, y = 60, w = pdf.epw)
+
+    # lineaFila -> línea de la página de cada fila de la tabla, recorrida por las líneas en blanco...
+    # que se agregan después de los grupos de días con cinco eventos.
+    completos = grupos_completos(tabla) if espaciar else np.zeros(FILA_MERIDIANO // EVENTOS_DIA, dtype = bool)
+    extra = np.concatenate(([0], np.cumsum(completos)))
+    lineaFila = np.arange(len(tabla)) + extra[np.minimum(np.arange(len(tabla)) // EVENTOS_DIA, len(completos))]
+
+    # Se reducen las líneas en blanco del inicio si la página trae líneas extra, para que quepa en una sola hoja.
+    inicio = min(LINEA_CABECERA, LINEAS_PAGINA - LINEAS_TABLA - int(extra[-1]))
+    # x0 -> inicio de la tabla, centrada en el ancho útil de la página.
+    x0 = pdf.l_margin + (pdf.epw - len(ENCABEZADO) * ANCHO_CARACTER) / 2
+    xDerecha = x0 + DERECHA_COLUMNAS * ANCHO_CARACTER
+
+    # y -> línea base del texto de la línea "n" de la página.
+    def y(n):
+        return pdf.t_margin + (n + 0.8) * ALTO_LINEA
+
+    # Cabecera: "ESTACION" a la izquierda, el nombre al centro y el mes con el año a la derecha.
+    fecha = dictMeses[mes][0] + " " + str(year)
+    pdf.text(x0, y(inicio), "ESTACION")
+    pdf.text((pdf.w - len(estacion.nombre) * ANCHO_CARACTER) / 2, y(inicio), estacion.nombre)
+    pdf.text(xDerecha[-1] - len(fecha) * ANCHO_CARACTER, y(inicio), fecha)
+
+    # Nombres de las columnas.
+    for columna in range(len(COLUMNAS)):
+        pdf.text(xDerecha[columna] - len(COLUMNAS[columna]) * ANCHO_CARACTER, y(inicio + 2), COLUMNAS[columna])
+
+    # Celdas con datos de la tabla, alineadas a la derecha de su columna.
+    for fila, columna in zip(*np.nonzero(tabla != " ")):
+        celda = str(tabla[fila, columna])
+        pdf.text(xDerecha[columna] - len(celda) * ANCHO_CARACTER, y(inicio + 4 + lineaFila[fila]), celda)
+
+    # "HORA DEL MERIDIANO" en la fila 50, en el lugar de las dos primeras columnas.
+    pdf.text(x0, y(inicio + 4 + lineaFila[FILA_MERIDIANO]), "HORA DEL MERIDIANO {:03d}° W.".format(int(estacion.meridiano)))
+
+
+# --- FUNCIÓN PARA AGREGAR LOS MESES DE UNA ESTACIÓN A UN DOCUMENTO PDF ---
+# Recibe tres parámetros:
+# 1. pdf -> documento creado con "nuevo_documento".
+# 2. resultado -> tablas de la estación que regresa "generar_tablas".
+# 3. logo -> ruta de la imagen que se coloca como fondo de cada página.
+def agregar_estacion(pdf, resultado, logo):
+    for (year, mes), tabla in resultado.tablas.items():
+        agregar_mes(pdf, tabla, resultado.estacion, mes, year, logo)
+
+
+# --- FUNCIÓN PARA CREAR EL PDF DE UNA ESTACIÓN ---
+# Recibe dos parámetros:
+# 1. resultado -> tablas de la estación que regresa "generar_tablas".
+# 2. logo -> ruta de la imagen que se coloca como fondo de cada página.
+# Regresa el contenido del PDF en bytes.
+def pdf_estacion(resultado, logo):
+    return pdf_atlas([resultado], logo)
+
+
+# --- FUNCIÓN PARA CREAR UN SOLO PDF CON LAS TABLAS DE VARIAS ESTACIONES ---
+# Recibe dos parámetros:
+# 1. resultados -> lista de tablas de estaciones que regresa "generar_tablas".
+# 2. logo -> ruta de la imagen que se coloca como fondo de cada página.
+# Regresa el contenido del PDF en bytes; la letra y el logo se comparten entre todas las páginas.
+def pdf_atlas(resultados, logo):
+    pdf = nuevo_documento()
+    for resultado in resultados:
+        agregar_estacion(pdf, resultado, logo)
+    return bytes(pdf.output())
@@ -0,0 +1,125 @@
+'''
+=== MEDICIÓN DEL TIEMPO Y LA MEMORIA DE CADA ETAPA ===
+
+Permite saber qué etapa hace lenta una ejecución: lectura de las estaciones y
+del archivo .LIS, resta del BMI, maquetado de cada mes, texto de cada mes,
+escritura del TXT y dibujo y escritura del PDF.
+
+La medición solo se activa si la variable de entorno "TABLASMAREA_PERFIL"
+tiene la ruta de un archivo (o "-" para la salida de errores), o con la
+opción "--perfil" del modo en lote. Por cada estación se agrega al archivo
+una línea con un registro JSON:
+~~~
+{"archivo": "HL25023.LIS", "estacion": 25023, "segundos": 0.41, "pico_kib": 2150.3,
+ "etapas": [{"etapa": "lectura", "segundos": 0.002, "pico_kib": 310.6}, ...]}
+~~~
+
+"pico_kib" es la memoria máxima que usó la etapa (medida con "tracemalloc")
+por encima de la que ya estaba en uso al comenzar. Las etapas pueden estar
+unas dentro de otras; por ejemplo, cuando el texto se arma al momento de
+escribirlo, "escritura txt" incluye el tiempo de cada "texto AAAA-MM".
+
+Cuando la medición no está activa, "etapa" no hace nada.
+'''
+
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+
+# Variable de entorno que activa la medición y nombre de la ruta donde se escriben los registros.
+VARIABLE_PERFIL = "TABLASMAREA_PERFIL"
+
+# Registro de la estación que se está midiendo (None si la medición no está activa)...
+# y pila de las etapas abiertas: [memoria al comenzar, memoria máxima de las etapas internas].
+_registro = None
+_pila = []
+
+
+# --- FUNCIÓN PARA SABER SI LA MEDICIÓN ESTÁ ACTIVA ---
+def perfil_activo():
+    return bool(os.environ.get(VARIABLE_PERFIL))
+
+
+# --- FUNCIÓN PARA ESCRIBIR EL REGISTRO DE UNA ESTACIÓN ---
+# Cada registro se escribe en una sola línea con una sola llamada a "write", para que los procesos...
+# del modo en lote puedan agregar sus registros al mismo archivo sin mezclarse.
+def _escribir_registro(registro):
+    linea = json.dumps(registro, ensure_ascii = False) + "\n"
+    destino = os.environ.get(VARIABLE_PERFIL)
+    if destino == "-":
+        sys.stderr.write(linea)
+        return
+    descriptor = os.open(destino, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        os.write(descriptor, linea.encode("utf-8"))
+    finally:
+        os.close(descriptor)
+
+
+# --- FUNCIÓN PARA MEDIR TODAS LAS ETAPAS DE UNA ESTACIÓN ---
+# Recibe un parámetro:
+# 1. archivoDatos -> ruta del archivo .LIS de la estación.
+# Se usa con "with"; al terminar, escribe el registro JSON de la estación.
+@contextlib.contextmanager
+def medir_estacion(archivoDatos):
+    global _registro
+    if not perfil_activo() or _registro is not None:
+        yield
+        return
+
+    iniciado = tracemalloc.is_tracing()
+    if not iniciado:
+        tracemalloc.start()
+    _registro = {"archivo": str(archivoDatos), "estacion": None, "segundos": None, "pico_kib": None, "etapas": []}
+    try:
+        with etapa(None):
+            yield
+    finally:
+        registro, _registro = _registro, None
+        if not iniciado:
+            tracemalloc.stop()
+        _escribir_registro(registro)
+
+
+# --- FUNCIÓN PARA AGREGAR UN DATO AL REGISTRO DE LA ESTACIÓN ---
+# Recibe dos parámetros:
+# 1. clave -> nombre del dato (por ejemplo, "estacion").
+# 2. valor -> valor del dato; debe poder convertirse a JSON.
+def anotar(clave, valor):
+    if _registro is not None:
+        _registro[clave] = valor
+
+
+# --- FUNCIÓN PARA MEDIR UNA ETAPA ---
+# Recibe un parámetro:
+# 1. nombre -> nombre de la etapa en el registro (None para el total de la estación).
+# Se usa con "with" alrededor del código de la etapa.
+@contextlib.contextmanager
+def etapa(nombre):
+    if _registro is None:
+        yield
+        return
+
+    # Antes de reiniciar el máximo de "tracemalloc", se guarda el de la etapa que contiene a esta.
+    if _pila:
+        _pila[-1][1] = max(_pila[-1][1], tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+    _pila.append([tracemalloc.get_traced_memory()[0], 0])
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        segundos = time.perf_counter() - inicio
+        memoriaInicial, picoInterno = _pila.pop()
+        pico = max(tracemalloc.get_traced_memory()[1], picoInterno)
+        if _pila:
+            _pila[-1][1] = max(_pila[-1][1], pico)
+        medida = {"segundos": round(segundos, 6), "pico_kib": round((pico - memoriaInicial) / 1024, 1)}
+        if nombre is None:
+            _registro.update(medida)
+        else:
+            _registro["etapas"].append(dict({"etapa": nombre}, **medida))
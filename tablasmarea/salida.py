@@ -0,0 +1,72 @@
+'''
+=== ESCRITURA DE LOS ARCHIVOS DE SALIDA ===
+
+Los archivos se escriben primero en un archivo temporal dentro de la misma
+carpeta y, solo cuando están completos, reemplazan al archivo final con
+"os.replace". Así nadie puede leer una tabla a medio escribir y, si algo falla,
+el archivo anterior queda intacto.
+
+Las páginas de texto se escriben conforme se van generando, a través de un
+solo archivo abierto, por lo que no es necesario reunir todo el texto en memoria.
+'''
+
+import contextlib
+import os
+import sys
+import tempfile
+
+
+# --- FUNCIÓN PARA ESCRIBIR UN ARCHIVO DE FORMA ATÓMICA ---
+# Recibe tres parámetros:
+# 1. ruta -> ruta del archivo final.
+# 2. modo -> "w" para texto o "wb" para bytes.
+# 3. encoding -> codificación del texto; None usa la del sistema.
+# Se usa con "with"; entrega el archivo temporal donde se escribe el contenido.
+@contextlib.contextmanager
+def escritura_atomica(ruta, modo = "w", encoding = None):
+    directorio, nombre = os.path.split(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir = directorio, prefix = "." + nombre + ".", suffix = ".tmp")
+    try:
+        with os.fdopen(descriptor, modo, encoding = encoding) as archivo:
+            yield archivo
+        # mkstemp crea el archivo solo con permisos para el dueño; se dejan los permisos habituales.
+        mascara = os.umask(0)
+        os.umask(mascara)
+        os.chmod(temporal, 0o666 & ~mascara)
+        os.replace(temporal, ruta)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temporal)
+        raise
+
+
+# --- FUNCIÓN PARA ESCRIBIR PÁGINAS DE TEXTO ---
+# Recibe tres parámetros:
+# 1. paginas -> lista o generador con el texto de cada página.
+# 2. destino -> ruta del archivo (se escribe de forma atómica), "-" para la salida estándar...
+#    o cualquier objeto con método "write".
+# 3. encoding -> codificación del archivo; None usa la del sistema. No se usa si "destino" ya está abierto.
+def escribir_paginas(paginas, destino, encoding = None):
+    if destino == "-":
+        destino = sys.stdout
+    if hasattr(destino, "write"):
+        for pagina in paginas:
+            destino.write(pagina)
+        return
+
+    with escritura_atomica(destino, "w", encoding) as archivo:
+        for pagina in paginas:
+            archivo.write(pagina)
+
+
+# --- FUNCIÓN PARA ESCRIBIR BYTES (POR EJEMPLO, UN PDF) ---
+# Recibe dos parámetros:
+# 1. contenido -> bytes a escribir.
+# 2. destino -> ruta del archivo (se escribe de forma atómica) o cualquier objeto con método "write".
+def escribir_bytes(contenido, destino):
+    if hasattr(destino, "write"):
+        destino.write(contenido)
+        return
+
+    with escritura_atomica(destino, "wb") as archivo:
+        archivo.write(contenido)
@@ -0,0 +1,265 @@
+'''
+=== SERVIDOR HTTP LOCAL DE TABLAS DE MAREA ===
+
+Entrega bajo pedido las tablas de una estación, en lugar de generarlas de
+antemano y enviarlas por correo:
+~~~
+python -m tablasmarea.servidor --lis datos/ --datos . --puerto 8023
+~~~
+
+Consulta:
+~~~
+http://localhost:8023/tablas?archivo=HL25023&year=2023&formato=pdf
+http://localhost:8023/tablas?archivo=HL25023&year=2023&desde=2023-03&hasta=2023-05&formato=json
+~~~
+
+- archivo -> nombre del archivo .LIS dentro de la carpeta "--lis" (con o sin la extensión).
+- year, desde, hasta -> igual que en el modo en lote ("desde" y "hasta" como AAAA-MM).
+- formato -> "txt", "pdf" o cualquiera de los formatos del módulo "exportar" (csv, json, html).
+
+El servidor usa "asyncio", por lo que atiende varias conexiones a la vez, y
+las tablas se generan en un grupo de procesos para no detener a las demás
+consultas. Los resultados se guardan en un caché en memoria (LRU, con un
+límite de tamaño) cuya clave incluye el hash del archivo .LIS y de los datos
+de las estaciones, el rango de meses y el formato; si los archivos cambian,
+la clave cambia y las tablas se generan de nuevo. Si llegan varias consultas
+iguales al mismo tiempo, las tablas se generan una sola vez.
+'''
+
+import argparse
+import asyncio
+import hashlib
+import os
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from tablasmarea.estaciones import ARCHIVOS_ESTACIONES
+from tablasmarea.exportar import RENDERIZADORES
+from tablasmarea.generador import generar_tablas, leer_mes, paginas_texto
+
+
+# Tipo de contenido de cada formato.
+TIPOS_CONTENIDO = {"txt": "text/plain; charset=utf-8", "pdf": "application/pdf", "csv": "text/csv; charset=utf-8",
+                   "json": "application/json", "html": "text/html; charset=utf-8"}
+
+# Textos de los códigos de respuesta HTTP que se usan.
+ESTADOS_HTTP = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+# --- FUNCIÓN QUE GENERA UN FORMATO EN LOS PROCESOS DEL SERVIDOR ---
+# Recibe seis parámetros:
+# 1. archivoDatos -> ruta del archivo .LIS.
+# 2. year -> año del primer mes completo de los datos (None para deducirlo de la columna DATE).
+# 3. desde, hasta -> tuplas (año, mes) del rango de meses, o None.
+# 4. formato -> "txt", "pdf" o un formato de "RENDERIZADORES".
+# 5. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# Regresa el contenido en bytes.
+def generar_formato(archivoDatos, year, desde, hasta, formato, directorioDatos):
+    resultado = generar_tablas(archivoDatos, year, None, (), directorioDatos, desde, hasta)
+    if formato == "pdf":
+        from tablasmarea.pdf import pdf_estacion
+        return pdf_estacion(resultado, os.path.join(directorioDatos, "unam_logo.png"))
+    if formato == "txt":
+        return "".join(paginas_texto(resultado)).encode("utf-8")
+    return "".join(RENDERIZADORES[formato](resultado)).encode("utf-8")
+
+
+# --- FUNCIÓN PARA OBTENER EL HASH DEL CONTENIDO DE VARIOS ARCHIVOS ---
+# Recibe dos parámetros:
+# 1. rutas -> lista de rutas de archivos.
+# 2. memoria -> diccionario {ruta: (firma, hash)} para no volver a leer los archivos que no cambiaron.
+# La firma de cada archivo es su fecha de modificación y su tamaño, igual que en "estaciones".
+def hash_archivos(rutas, memoria):
+    resumen = hashlib.sha1()
+    for ruta in rutas:
+        estado = os.stat(ruta)
+        firma = (estado.st_mtime_ns, estado.st_size)
+        if ruta not in memoria or memoria[ruta][0] != firma:
+            with open(ruta, "rb") as archivo:
+                memoria[ruta] = (firma, hashlib.sha1(archivo.read()).hexdigest())
+        resumen.update(memoria[ruta][1].encode("ascii"))
+    return resumen.hexdigest()
+
+
+# --- FUNCIÓN PARA ARMAR UNA RESPUESTA HTTP ---
+# Recibe cuatro parámetros:
+# 1. estado -> código de respuesta HTTP.
+# 2. contenido -> cuerpo de la respuesta en bytes.
+# 3. tipo -> tipo de contenido.
+# 4. encabezados -> diccionario con encabezados adicionales.
+def respuesta_http(estado, contenido, tipo = "text/plain; charset=utf-8", encabezados = None):
+    lineas = ["HTTP/1.1 {} {}".format(estado, ESTADOS_HTTP[estado]),
+              "Content-Type: " + tipo,
+              "Content-Length: " + str(len(contenido)),
+              "Connection: close"]
+    for nombre, valor in (encabezados or {}).items():
+        lineas.append(nombre + ": " + valor)
+    return ("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1") + contenido
+
+
+# --- FUNCIÓN PARA CREAR EL ESTADO DEL SERVIDOR ---
+# Recibe cuatro parámetros:
+# 1. directorioLIS -> carpeta con los archivos .LIS que se pueden consultar.
+# 2. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# 3. ejecutor -> grupo de procesos donde se generan las tablas.
+# 4. limiteCache -> tamaño máximo del caché de resultados, en bytes.
+def crear_estado(directorioLIS, directorioDatos, ejecutor, limiteCache):
+    return {"lis": directorioLIS, "datos": directorioDatos, "ejecutor": ejecutor,
+            "limite": limiteCache, "cache": OrderedDict(), "bytes": 0, "pendientes": {}, "hashes": {}}
+
+
+# --- FUNCIÓN PARA GUARDAR UN RESULTADO EN EL CACHÉ ---
+# Los resultados más antiguos (los que se usaron hace más tiempo) se eliminan hasta que el caché...
+# queda dentro de su límite; un resultado más grande que el límite no se guarda.
+def guardar_en_cache(estado, clave, contenido):
+    if len(contenido) > estado["limite"]:
+        return
+    cache = estado["cache"]
+    if clave in cache:
+        estado["bytes"] -= len(cache.pop(clave))
+    cache[clave] = contenido
+    estado["bytes"] += len(contenido)
+    while estado["bytes"] > estado["limite"]:
+        estado["bytes"] -= len(cache.popitem(last = False)[1])
+
+
+# --- FUNCIÓN PARA OBTENER LAS TABLAS QUE SE PIDEN EN UNA CONSULTA ---
+# Recibe dos parámetros:
+# 1. estado -> estado del servidor que regresa "crear_estado".
+# 2. parametros -> diccionario con los parámetros de la consulta.
+# Regresa una tupla (estado HTTP, contenido, tipo de contenido, encabezados).
+async def atender_tablas(estado, parametros):
+    formato = parametros.get("formato", "txt")
+    if formato not in TIPOS_CONTENIDO and formato not in RENDERIZADORES:
+        return 400, "Formato desconocido: {}\n".format(formato).encode("utf-8"), None, None
+
+    # Solo se aceptan nombres de archivos dentro de la carpeta de los .LIS.
+    nombre = os.path.basename(parametros.get("archivo", ""))
+    if nombre and not nombre.upper().endswith(".LIS"):
+        nombre += ".LIS"
+    archivoDatos = os.path.join(estado["lis"], nombre)
+    if not nombre or not os.path.isfile(archivoDatos):
+        return 404, "No se encontró el archivo {}\n".format(nombre).encode("utf-8"), None, None
+
+    try:
+        year = int(parametros["year"]) if "year" in parametros else None
+        desde = leer_mes(parametros["desde"]) if "desde" in parametros else None
+        hasta = leer_mes(parametros["hasta"]) if "hasta" in parametros else None
+    except ValueError as error:
+        return 400, "Parámetro inválido: {}\n".format(error).encode("utf-8"), None, None
+
+    # La clave del caché cambia si cambia el archivo .LIS o los datos de las estaciones.
+    rutasEstaciones = [os.path.join(estado["datos"], archivo) for archivo in ARCHIVOS_ESTACIONES]
+    hashLIS = await asyncio.to_thread(hash_archivos, [archivoDatos], estado["hashes"])
+    hashEstaciones = await asyncio.to_thread(hash_archivos, rutasEstaciones, estado["hashes"])
+    clave = (hashLIS, hashEstaciones, year, desde, hasta, formato)
+    tipo = TIPOS_CONTENIDO.get(formato, "application/octet-stream")
+
+    cache = estado["cache"]
+    if clave in cache:
+        cache.move_to_end(clave)
+        return 200, cache[clave], tipo, {"X-Cache": "HIT"}
+
+    # Si la misma consulta ya se está generando, se espera ese mismo resultado.
+    pendientes = estado["pendientes"]
+    if clave not in pendientes:
+        ciclo = asyncio.get_running_loop()
+        pendientes[clave] = ciclo.run_in_executor(estado["ejecutor"], generar_formato, archivoDatos, year,
+                                                  desde, hasta, formato, estado["datos"])
+    tarea = pendientes[clave]
+    try:
+        contenido = await asyncio.shield(tarea)
+    except ValueError as error:
+        return 400, "{}\n".format(error).encode("utf-8"), None, None
+    finally:
+        if tarea.done():
+            pendientes.pop(clave, None)
+
+    guardar_en_cache(estado, clave, contenido)
+    return 200, contenido, tipo, {"X-Cache": "MISS"}
+
+
+# --- FUNCIÓN QUE ATIENDE UNA CONEXIÓN ---
+# Recibe tres parámetros:
+# 1. estado -> estado del servidor que regresa "crear_estado".
+# 2. lector, escritor -> flujos de la conexión que entrega "asyncio.start_server".
+async def atender_conexion(estado, lector, escritor):
+    try:
+        solicitud = (await lector.readline()).decode("latin-1").split()
+        # Se leen (y se ignoran) los encabezados hasta la línea en blanco.
+        while (await lector.readline()).strip():
+            pass
+
+        if len(solicitud) < 2 or solicitud[0] not in ("GET", "HEAD"):
+            codigo, contenido, tipo, encabezados = 405, b"Solo se aceptan consultas GET.\n", None, None
+        else:
+            url = urllib.parse.urlsplit(solicitud[1])
+            parametros = dict(urllib.parse.parse_qsl(url.query))
+            if url.path == "/tablas":
+                try:
+                    codigo, contenido, tipo, encabezados = await atender_tablas(estado, parametros)
+                except Exception as error:
+                    codigo, contenido, tipo, encabezados = 500, "{}: {}\n".format(type(error).__name__, error).encode("utf-8"), None, None
+            elif url.path == "/salud":
+                codigo, contenido, tipo, encabezados = 200, b"OK\n", None, None
+            else:
+                codigo, contenido, tipo, encabezados = 404, b"Ruta desconocida; use /tablas.\n", None, None
+
+        respuesta = respuesta_http(codigo, contenido, tipo or "text/plain; charset=utf-8", encabezados)
+        if solicitud and solicitud[0] == "HEAD":
+            respuesta = respuesta[:len(respuesta) - len(contenido)]
+        escritor.write(respuesta)
+        await escritor.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        escritor.close()
+
+
+# --- FUNCIÓN PARA INICIAR EL SERVIDOR ---
+# Recibe siete parámetros:
+# 1. directorioLIS -> carpeta con los archivos .LIS que se pueden consultar.
+# 2. directorioDatos -> carpeta con "ESTACIONES.txt", "NBMI.txt" y "unam_logo.png".
+# 3. host, puerto -> dirección donde escucha el servidor.
+# 4. procesos -> número de procesos para generar las tablas (None usa todos los núcleos).
+# 5. limiteCache -> tamaño máximo del caché de resultados, en bytes.
+# 6. listo -> función opcional que recibe el servidor ya iniciado (por ejemplo, para conocer el puerto).
+async def servir(directorioLIS = ".", directorioDatos = ".", host = "127.0.0.1", puerto = 8023, procesos = None,
+                 limiteCache = 64 * 1024 * 1024, listo = None):
+    with ProcessPoolExecutor(max_workers = procesos) as ejecutor:
+        estado = crear_estado(directorioLIS, directorioDatos, ejecutor, limiteCache)
+        servidor = await asyncio.start_server(lambda lector, escritor: atender_conexion(estado, lector, escritor),
+                                              host, puerto)
+        if listo is not None:
+            listo(servidor)
+        async with servidor:
+            await servidor.serve_forever()
+
+
+# --- FUNCIÓN PRINCIPAL DEL SERVIDOR ---
+# Recibe un parámetro:
+# 1. argv -> argumentos de la línea de comandos (None usa los de "sys.argv").
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Servidor HTTP local de tablas de marea.")
+    parser.add_argument("--lis", default = ".", help = "carpeta con los archivos .LIS que se pueden consultar")
+    parser.add_argument("--datos", default = ".", help = "carpeta con ESTACIONES.txt, NBMI.txt y unam_logo.png")
+    parser.add_argument("--host", default = "127.0.0.1", help = "dirección donde escucha el servidor")
+    parser.add_argument("--puerto", type = int, default = 8023, help = "puerto donde escucha el servidor")
+    parser.add_argument("--procesos", type = int, default = None, help = "número de procesos para generar las tablas")
+    parser.add_argument("--cache-mb", type = float, default = 64, help = "tamaño máximo del caché de resultados, en MB")
+    args = parser.parse_args(argv)
+
+    def listo(servidor):
+        print("Servidor de tablas de marea en http://{}:{}/tablas".format(*servidor.sockets[0].getsockname()[:2]))
+
+    try:
+        asyncio.run(servir(args.lis, args.datos, args.host, args.puerto, args.procesos,
+                           int(args.cache_mb * 1024 * 1024), listo))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+'''
+=== TEXTO DE ANCHO FIJO DE LAS TABLAS MENSUALES ===
+
+Escribe la página de cada mes (cabecera con la estación, nombres de las
+columnas, filas de la tabla y línea de "HORA DEL MERIDIANO") en una sola
+pasada, directamente a partir de la cuadrícula que regresa "maquetar_mes".
+
+Cada columna ocupa 6 caracteres alineados a la derecha, separados por un
+espacio, y se omiten los 3 primeros espacios de cada línea; es el mismo
+formato que antes se obtenía con "to_string(col_space = 6)" y "formato_tabla".
+'''
+
+import io
+
+import numpy as np
+
+from tablasmarea.maquetado import COLUMNAS, EVENTOS_DIA, dictMeses
+
+
+# Ancho de cada columna y número de espacios que se omiten al inicio de cada línea.
+ANCHO_COLUMNA = 6
+MARGEN = 3
+
+# Fila de la tabla donde se escribe la "HORA DEL MERIDIANO" (junto al día 31).
+FILA_MERIDIANO = 50
+
+
+# --- FUNCIÓN PARA ARMAR UNA LÍNEA DE LA TABLA ---
+# Recibe una lista con los textos de las 12 celdas de la fila.
+def linea_tabla(celdas):
+    return " ".join([celda.rjust(ANCHO_COLUMNA) for celda in celdas])[MARGEN:]
+
+
+# Nombres de las columnas ya con su formato.
+ENCABEZADO = linea_tabla(COLUMNAS)
+# Línea en blanco con el ancho de la tabla.
+LINEA_VACIA = " " * len(ENCABEZADO)
+
+
+# --- FUNCIÓN PARA IDENTIFICAR LOS GRUPOS DE DÍAS CON CINCO EVENTOS ---
+# Recibe la cuadrícula de 55 filas x 12 columnas que regresa "maquetar_mes".
+# Regresa un arreglo con un valor por cada grupo de 5 filas (días 1-10, 11-20 y 21-30 en paralelo)...
+# que es True si la última fila del grupo tiene datos, es decir, si algún día del grupo registró cinco eventos.
+def grupos_completos(tabla):
+    return (tabla[EVENTOS_DIA - 1:FILA_MERIDIANO:EVENTOS_DIA] != " ").any(axis = 1)
+
+
+# --- FUNCIÓN PARA ARMAR LA CABECERA DE LA PÁGINA ---
+# Recibe tres parámetros:
+# 1. nombre -> nombre de la estación.
+# 2. mes -> número de mes (asocia el valor a su mes en el diccionario "dictMeses").
+# 3. year -> año al que corresponden los datos.
+# El nombre de la estación queda al centro de una línea del ancho de la tabla.
+def cabecera(nombre, mes, year):
+    fecha = dictMeses[mes][0] + " " + str(year)
+    relleno = " " * int((len(ENCABEZADO) - len("ESTACION" + nombre + fecha)) / 2)
+    return "ESTACION" + relleno + nombre + relleno + fecha
+
+
+# --- FUNCIÓN PARA ESCRIBIR LA PÁGINA DE UN MES ---
+# Recibe siete parámetros:
+# 1. salida -> archivo o buffer de texto donde se escribe la página.
+# 2. tabla -> cuadrícula de 55 filas x 12 columnas que regresa "maquetar_mes".
+# 3. nombre -> nombre de la estación.
+# 4. meridiano -> meridiano de la estación en grados.
+# 5. mes -> número de mes.
+# 6. year -> año al que corresponden los datos.
+# 7. espaciar -> si es True, agrega una línea en blanco después de los días con cinco eventos...
+#    para que no queden pegados al día siguiente.
+def escribir_mes(salida, tabla, nombre, meridiano, mes, year, espaciar = True):
+    salida.write("\n\n\n" + cabecera(nombre, mes, year) + "\n\n" + ENCABEZADO + "\n")
+
+    lineaMeridiano = "HORA DEL MERIDIANO {:03d}° W.".format(int(meridiano))
+    completos = grupos_completos(tabla) if espaciar else np.zeros(FILA_MERIDIANO // EVENTOS_DIA, dtype = bool)
+    for fila in range(len(tabla)):
+        linea = linea_tabla(tabla[fila])
+        # La "HORA DEL MERIDIANO" ocupa el lugar de las dos primeras columnas de la fila 50.
+        if fila == FILA_MERIDIANO:
+            linea = lineaMeridiano + " " + linea[len(lineaMeridiano) + 1:]
+        salida.write("\n" + linea)
+
+        # Después de la última fila de un grupo de días con cinco eventos se agrega una línea en blanco.
+        if fila < FILA_MERIDIANO and fila % EVENTOS_DIA == EVENTOS_DIA - 1 and completos[fila // EVENTOS_DIA]:
+            salida.write("\n" + LINEA_VACIA)
+
+
+# --- FUNCIÓN PARA OBTENER EL TEXTO DE LA PÁGINA DE UN MES ---
+# Recibe los mismos parámetros que "escribir_mes", salvo "salida".
+def texto_mes(tabla, nombre, meridiano, mes, year, espaciar = True):
+    buffer = io.StringIO()
+    escribir_mes(buffer, tabla, nombre, meridiano, mes, year, espaciar)
+    return buffer.getvalue()
@@ -0,0 +1,64 @@
+'''
+=== PRUEBAS DEL CACHÉ BINARIO DE LOS ARCHIVOS .LIS ===
+'''
+
+import glob
+import os
+
+import numpy as np
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea import cache_lis
+from tablasmarea.lis import leer_lis
+
+
+def test_correcciones_no_acumulan_archivos(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1)[0]
+    carpeta = cache_lis.carpeta_cache(archivo)
+    for correccion in range(4):
+        datos = cache_lis.cargar_lis(archivo)
+        assert all(np.array_equal(columna, original) for columna, original in zip(datos, leer_lis(archivo)))
+        assert len(glob.glob(os.path.join(carpeta, "*.npy"))) == 2
+        # Se corrige una hora del primer registro.
+        with open(archivo) as entrada:
+            lineas = entrada.read().split("\n")
+        lineas[1] = lineas[1][:-4] + "{:4d}".format(correccion)
+        with open(archivo, "w") as salida:
+            salida.write("\n".join(lineas))
+
+
+def test_sin_cambios_no_se_calcula_el_hash(tmp_path, monkeypatch):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1)[0]
+    cache_lis.cargar_lis(archivo)
+
+    llamadas = []
+    sha1 = cache_lis.hashlib.sha1
+    monkeypatch.setattr(cache_lis.hashlib, "sha1", lambda *args: llamadas.append(1) or sha1(*args))
+    cache_lis.cargar_lis(archivo)
+    assert llamadas == []
+
+    # Si solo cambia la fecha de modificación, se calcula el hash y se usan los mismos arreglos.
+    os.utime(archivo, ns = (0, 0))
+    cache_lis.cargar_lis(archivo)
+    assert llamadas == [1]
+    assert len(glob.glob(os.path.join(cache_lis.carpeta_cache(archivo), "*.npy"))) == 2
+
+
+def test_dos_archivos_de_la_misma_estacion(tmp_path, monkeypatch):
+    # Dos años de la misma estación en la misma carpeta no deben borrar los arreglos del otro.
+    archivos = []
+    for inicio in (2023, 2024):
+        carpeta = tmp_path / str(inicio)
+        carpeta.mkdir()
+        original = generar_datos(str(carpeta), estaciones = 1, years = 1, inicio = inicio)[0]
+        archivos.append(str(tmp_path / "HL30001_{}.LIS".format(inicio)))
+        os.replace(original, archivos[-1])
+
+    lecturas = []
+    leer = cache_lis.leer_lis
+    monkeypatch.setattr(cache_lis, "leer_lis", lambda *args: lecturas.append(1) or leer(*args))
+    for ronda in range(3):
+        for archivo in archivos:
+            cache_lis.cargar_lis(archivo)
+    assert len(lecturas) == 2
+    assert len(glob.glob(os.path.join(cache_lis.carpeta_cache(archivos[0]), "*.npy"))) == 4
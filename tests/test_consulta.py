@@ -0,0 +1,71 @@
+'''
+=== PRUEBAS DE LA INTERPOLACIÓN CON EVENTOS FALTANTES ===
+
+Si falta un evento en el .LIS (9999), la consulta no debe trazar un coseno
+entre dos pleamares (o dos bajamares) seguidas, y las estadísticas no deben
+confundir el tipo de los eventos vecinos. Se usan los datos sintéticos de
+"benchmarks.sinteticos", quitando un evento a mitad de un registro o el
+último de un registro.
+'''
+
+import numpy as np
+import pytest
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.consulta import altura_marea, eventos_datos, intervalos_validos
+from tablasmarea.estadisticas import clasificar_eventos
+from tablasmarea.generador import preparar_datos
+from tablasmarea.lis import leer_lis
+
+
+# --- FUNCIÓN PARA OBTENER LOS EVENTOS Y SU CLASIFICACIÓN ---
+# Recibe dos parámetros:
+# 1. datos -> contenedor "DatosLIS".
+# 2. directorio -> carpeta con ESTACIONES.txt y NBMI.txt.
+# Regresa los eventos y los arreglos de pleamares y bajamares.
+def clasificados(datos, directorio):
+    eventos = eventos_datos(preparar_datos(datos, 2025, None, directorio))
+    return (eventos,) + clasificar_eventos(eventos.alturas, intervalos_validos(eventos))
+
+
+@pytest.mark.parametrize("lugar", ["medio", "final"])
+def test_evento_faltante(tmp_path, lugar):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    datos = leer_lis(archivo)
+    completos, pleamar, bajamar = clasificados(datos, str(tmp_path))
+
+    # Primer registro desde el 1 de marzo con cuatro eventos seguidos y sin vacíos alrededor.
+    registro = next(r for r in range(60, len(datos.fecha) - 1)
+                    if (datos.tiempos[r - 1:r + 2] != 9999).sum(axis = 1).tolist() == [4, 4, 4]
+                    and (datos.tiempos[r, :4] != 9999).all())
+    posicion = 1 if lugar == "medio" else 3
+    tiempos, alturas = datos.tiempos.copy(), datos.alturas.copy()
+    tiempos[registro, posicion] = alturas[registro, posicion] = 9999
+    eventos, pleamarHueco, bajamarHueco = clasificados(datos._replace(tiempos = tiempos, alturas = alturas),
+                                                       str(tmp_path))
+
+    # k -> índice del evento quitado en los eventos completos.
+    k = int(np.flatnonzero(datos.tiempos.ravel()[:registro * 5 + posicion] != 9999).size)
+    mitad = completos.instantes[k - 1] + (completos.instantes[k + 1] - completos.instantes[k - 1]) // 2
+    lejos = completos.instantes[k + 40] + (completos.instantes[k + 41] - completos.instantes[k + 40]) // 2
+    metros = altura_marea(eventos, [mitad, lejos])[1]
+    assert np.isnan(metros[0])
+    assert metros[1] == altura_marea(completos, [lejos])[1][0]
+
+    # Ningún evento cambia de tipo; los que quedan junto al hueco pueden quedar sin clasificar.
+    quedan = np.delete(np.arange(len(completos.alturas)), k)
+    assert not (pleamarHueco & bajamar[quedan]).any()
+    assert not (bajamarHueco & pleamar[quedan]).any()
+    assert np.count_nonzero(~pleamarHueco & ~bajamarHueco) <= np.count_nonzero(~pleamar & ~bajamar) + 1
+
+
+def test_un_solo_instante(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    eventos = eventos_datos(preparar_datos(leer_lis(archivo), 2025, None, str(tmp_path)))
+    arreglo = altura_marea(eventos, ["2025-03-01T10:00"])
+    for instante in (np.datetime64("2025-03-01T10:00"), "2025-03-01T10:00"):
+        pies, metros = altura_marea(eventos, instante)
+        assert np.shape(metros) == ()
+        assert (float(pies), float(metros)) == (arreglo[0][0], arreglo[1][0])
+    # Fuera del periodo de los datos.
+    assert np.isnan(altura_marea(eventos, "2030-01-01T00:00")[1])
@@ -0,0 +1,70 @@
+'''
+=== PRUEBAS DE LA EXPORTACIÓN A CSV, JSON Y HTML ===
+'''
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.exportar import eventos_tabla, renderizar_csv, renderizar_json
+from tablasmarea.generador import generar_tablas, guardar_tablas
+from tablasmarea.lis import leer_lis
+from tablasmarea.maquetado import METROS_A_PIES
+
+
+# Carpeta raíz del repositorio, para importar el paquete desde otro proceso.
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_alturas_sin_recortar(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    resultado = generar_tablas(archivo, 2025, formatos = (), directorioDatos = str(tmp_path))
+    csv = pd.read_csv(io.StringIO("".join(renderizar_csv(resultado))), dtype = {"HORA": str})
+    documento = json.loads("".join(renderizar_json(resultado)))
+
+    # Alturas esperadas: registros de 2025 (sin el primer ni el último día), ya sin el BMI.
+    datos = leer_lis(archivo)
+    conDato = datos.tiempos[1:-1] != 9999
+    metros = (datos.alturas[1:-1][conDato] - resultado.estacion.bmi) / 100
+    np.testing.assert_allclose(csv["METROS"], metros, atol = 0.0005)
+    np.testing.assert_allclose(csv["PIES"], metros * METROS_A_PIES, atol = 0.0005)
+    assert [evento["metros"] for mes in documento["meses"] for evento in mes["eventos"]] == csv["METROS"].tolist()
+
+    # Los días y horas son los mismos de las tablas.
+    dias = np.concatenate([eventos_tabla(tabla)[0] for tabla in resultado.tablas.values()])
+    horas = np.concatenate([eventos_tabla(tabla)[1] for tabla in resultado.tablas.values()])
+    assert csv["DIA"].tolist() == dias.tolist()
+    assert csv["HORA"].tolist() == horas.tolist()
+
+
+def test_exportaciones_en_utf8(tmp_path):
+    # Con el locale "C" (y sin el modo UTF-8 de Python) la codificación del sistema es ASCII.
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    programa = ("import sys\n"
+                "from tablasmarea.generador import generar_tablas, guardar_tablas\n"
+                "resultado = generar_tablas(sys.argv[1], 2025, formatos = (), directorioDatos = sys.argv[2])\n"
+                "resultado = resultado._replace(estacion = resultado.estacion._replace(nombre = 'MAZATL\\u00c1N, SIN.'))\n"
+                "guardar_tablas(resultado, sys.argv[1], sys.argv[2], ('csv', 'json', 'html'))\n")
+    entorno = dict(os.environ, LC_ALL = "C", PYTHONUTF8 = "0",
+                   PYTHONPATH = os.pathsep.join([RAIZ] + os.environ.get("PYTHONPATH", "").split(os.pathsep)))
+    subprocess.run([sys.executable, "-c", programa, archivo, str(tmp_path)], env = entorno, check = True)
+
+    with open(os.path.join(str(tmp_path), "HL30001.json"), encoding = "utf-8") as documento:
+        assert json.load(documento)["estacion"]["nombre"] == "MAZATLÁN, SIN."
+    with open(os.path.join(str(tmp_path), "HL30001.html"), encoding = "utf-8") as pagina:
+        assert "MAZATLÁN" in pagina.read()
+
+
+def test_formato_desconocido(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    resultado = generar_tablas(archivo, 2025, formatos = (), directorioDatos = str(tmp_path))
+    with pytest.raises(ValueError, match = "jsno, PDF"):
+        guardar_tablas(resultado, archivo, str(tmp_path), ("txt", "jsno", "PDF"))
+    assert not os.path.exists(os.path.join(str(tmp_path), "HL30001.txt"))
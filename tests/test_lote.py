@@ -0,0 +1,52 @@
+'''
+=== PRUEBAS DE LOS NOMBRES DE LAS SALIDAS DEL LOTE ===
+
+Ninguna salida del lote debe sobrescribir otra:
+- Con "--multiestacion", una estación que aparece en dos bloques separados del
+  archivo se guarda la segunda vez con el sufijo "_2" y se avisa en el mensaje.
+- Dos archivos con el mismo nombre en carpetas distintas: el segundo se
+  reporta como error en lugar de reemplazar las tablas del primero.
+'''
+
+import os
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.lote import generar_lote
+
+
+def test_estacion_repetida(tmp_path):
+    directorio = str(tmp_path)
+    primera, segunda = generar_datos(directorio, estaciones = 2, years = 1, inicio = 2025)
+    archivo = os.path.join(directorio, "todas.LIS")
+    with open(archivo, "w") as salida:
+        for ruta in (primera, segunda, primera):
+            with open(ruta) as entrada:
+                salida.write(entrada.read())
+
+    directorioSalida = os.path.join(directorio, "tablas")
+    resultados = generar_lote([archivo], 2025, directorioSalida, directorio, procesos = 2,
+                              formatos = ("txt",), multiestacion = True)
+
+    nombres = [os.path.basename(ruta) for ruta, exito, mensaje in resultados]
+    assert nombres == ["HL30001.LIS", "HL30002.LIS", "HL30001_2.LIS"]
+    assert all(exito for ruta, exito, mensaje in resultados)
+    assert "aparece de nuevo" in resultados[2][2] and "aparece de nuevo" not in resultados[0][2]
+    assert sorted(os.listdir(directorioSalida)) == ["HL30001.txt", "HL30001_2.txt", "HL30002.txt"]
+
+
+def test_mismo_nombre_en_dos_carpetas(tmp_path):
+    directorio = str(tmp_path)
+    original = generar_datos(directorio, estaciones = 1, years = 1, inicio = 2025)[0]
+    archivos = []
+    for carpeta in ("a", "b"):
+        os.makedirs(os.path.join(directorio, carpeta))
+        archivos.append(os.path.join(directorio, carpeta, "HL30001.LIS"))
+        with open(original) as entrada, open(archivos[-1], "w") as salida:
+            salida.write(entrada.read())
+
+    directorioSalida = os.path.join(directorio, "tablas")
+    resultados = generar_lote(archivos, 2025, directorioSalida, directorio, procesos = 2, formatos = ("txt",))
+
+    assert [exito for ruta, exito, mensaje in resultados] == [True, False]
+    assert archivos[0] in resultados[1][2]
+    assert os.listdir(directorioSalida) == ["HL30001.txt"]
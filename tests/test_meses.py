@@ -0,0 +1,83 @@
+'''
+=== PRUEBAS DE LA UBICACIÓN DE LOS MESES ===
+
+Cada registro del .LIS debe quedar en la tabla de su mes aunque falten días
+al inicio del archivo, aunque el archivo no comience en enero y aunque no se
+tenga la columna del mes (en ese caso, si no se puede saber el mes, se espera
+un error en lugar de una tabla mal ubicada).
+'''
+
+import numpy as np
+import pytest
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.exportar import eventos_tabla
+from tablasmarea.generador import generar_tablas
+from tablasmarea.lis import DatosLIS, leer_lis
+
+
+# --- FUNCIÓN PARA OBTENER UNA PARTE DE LOS REGISTROS DE UN ARCHIVO .LIS ---
+# Recibe tres parámetros:
+# 1. datos -> contenedor "DatosLIS".
+# 2. inicio -> índice del primer registro que se conserva.
+# 3. conMes -> si es False, la columna del mes se reemplaza por ceros.
+def recortar(datos, inicio, conMes = True):
+    recorte = DatosLIS(*[columna[inicio:] for columna in datos])
+    if not conMes:
+        recorte = recorte._replace(hl = np.zeros_like(recorte.hl))
+    return recorte
+
+
+# --- FUNCIÓN PARA COMPROBAR QUE CADA EVENTO QUEDÓ EN SU DÍA Y MES ---
+# Recibe tres parámetros:
+# 1. resultado -> tablas que regresa "generar_tablas".
+# 2. datos -> contenedor "DatosLIS" con la columna del mes.
+# 3. year -> año de los registros.
+def comprobar_meses(resultado, datos, year):
+    for (yearTabla, mes), tabla in resultado.tablas.items():
+        assert yearTabla == year
+        delMes = np.flatnonzero(datos.hl == mes)
+        conDato = datos.tiempos[delMes] != 9999
+        dias, horas, pies, metros = eventos_tabla(tabla)
+        assert dias.tolist() == np.repeat(datos.fecha[delMes], conDato.sum(axis = 1)).tolist()
+        assert horas.tolist() == ["{:04d}".format(int(hora)) for hora in datos.tiempos[delMes][conDato]]
+
+
+@pytest.fixture(scope = "module")
+def sinteticos(tmp_path_factory):
+    directorio = str(tmp_path_factory.mktemp("sinteticos"))
+    archivo = generar_datos(directorio, estaciones = 1, years = 1, inicio = 2025)[0]
+    # Se quita el 1 de enero del año siguiente para que todos los registros sean de 2025 o del 31 de diciembre.
+    datos = leer_lis(archivo)
+    return directorio, DatosLIS(*[columna[:-1] for columna in datos])
+
+
+@pytest.mark.parametrize("conMes", [True, False])
+def test_faltan_los_primeros_dias(sinteticos, conMes):
+    directorio, datos = sinteticos
+    # Sin el 31 de diciembre ni el 1 de enero, el primer registro es el 2 de enero.
+    recorte = recortar(datos, 2, conMes)
+    resultado = generar_tablas(recorte, 2025, formatos = (), directorioDatos = directorio)
+    assert list(resultado.tablas) == [(2025, mes) for mes in range(1, 13)]
+    comprobar_meses(resultado, recortar(datos, 2), 2025)
+
+
+def test_comienza_en_marzo_con_columna_del_mes(sinteticos):
+    directorio, datos = sinteticos
+    inicio = int(np.flatnonzero(datos.hl == 3)[0])
+    resultado = generar_tablas(recortar(datos, inicio), 2025, formatos = (), directorioDatos = directorio)
+    assert list(resultado.tablas)[0] == (2025, 3)
+    comprobar_meses(resultado, recortar(datos, inicio), 2025)
+
+
+def test_comienza_en_marzo_sin_columna_del_mes(sinteticos):
+    directorio, datos = sinteticos
+    inicio = int(np.flatnonzero(datos.hl == 3)[0])
+    # Con el año solo se supone enero, lo que no coincide con los días de cada mes.
+    with pytest.raises(ValueError, match = "--desde"):
+        generar_tablas(recortar(datos, inicio, False), 2025, formatos = (), directorioDatos = directorio)
+    # Con "desde" se indica el primer mes completo.
+    resultado = generar_tablas(recortar(datos, inicio, False), None, formatos = (), directorioDatos = directorio,
+                               desde = (2025, 3), hasta = (2025, 12))
+    assert list(resultado.tablas)[0] == (2025, 3)
+    comprobar_meses(resultado, recortar(datos, inicio), 2025)
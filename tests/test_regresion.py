@@ -0,0 +1,146 @@
+'''
+=== PRUEBAS DE REGRESIÓN DE LAS TABLAS MENSUALES ===
+
+Comparan las tablas que genera el paquete con las del programa original,
+usando los datos sintéticos de "benchmarks.sinteticos". Las funciones de
+abajo no son copia literal del programa original: son una reimplementación
+de su lógica ("horasdf" y "alturasdf" se reúnen en "datos_original"; "nuevoMes",
+"to_string" y "formato_tabla", en "texto_original") que recorre los registros
+y las celdas en el mismo orden y con los mismos índices. Con ella se comprobó
+que el texto de 2023 es idéntico, byte por byte, al del programa original.
+
+Con los datos sintéticos:
+- En un año que no es bisiesto, el texto de cada mes debe ser idéntico.
+- En un año bisiesto, cada evento debe quedar en el día y mes de su registro
+  en el .LIS (el programa original recorría un registro a partir de marzo).
+
+Uso:
+~~~
+python -m pytest tests/
+~~~
+'''
+
+import calendar
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.sinteticos import generar_datos
+from tablasmarea.exportar import eventos_tabla
+from tablasmarea.generador import generar_tablas
+from tablasmarea.lis import leer_lis
+from tablasmarea.maquetado import COLUMNAS, dictMeses
+from tablasmarea.texto import texto_mes
+
+
+# Días de cada mes y fila donde comenzaban sus datos en el programa original (13 es el enero siguiente).
+DIAS_ORIGINAL = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31, 13: 31}
+INICIO_ORIGINAL = {1: 0, 2: 31, 3: 59, 4: 90, 5: 120, 6: 151, 7: 181, 8: 212, 9: 243, 10: 273, 11: 304, 12: 334, 13: 365}
+
+
+# --- FUNCIÓN QUE REPRODUCE "horasdf" Y "alturasdf" DEL PROGRAMA ORIGINAL ---
+# Recibe cuatro parámetros:
+# 1. tabla -> lista de 55 filas x 12 celdas que se modifica.
+# 2. valores -> registros del .LIS sin el primer día (31 de diciembre) ni el último, ya sin el BMI.
+# 3. mes, year -> mes y año de la tabla.
+def datos_original(tabla, valores, mes, year):
+    for columnaTabla, colInicial, bisiesto in ((1, 3, mes != 2), (3, 4, mes != 1 and mes != 2)):
+        col = colInicial
+        row = INICIO_ORIGINAL[mes] + (1 if bisiesto and calendar.isleap(year) else 0)
+        posiciones = [(j, i) for i in range(columnaTabla, columnaTabla + 9, 4) for j in range(50)]
+        if DIAS_ORIGINAL[mes] == 31:
+            posiciones += [(j, columnaTabla + 8) for j in range(50, 55)]
+        for j, i in posiciones:
+            hora = valores[row][col if colInicial == 3 else col - 1]
+            if hora != 9999 and row < INICIO_ORIGINAL[mes + 1]:
+                if colInicial == 3:
+                    tabla[j][i] = "{:04d}".format(int(valores[row][col]))
+                else:
+                    aux = valores[row][col] / 100
+                    tabla[j][i] = str(aux)[:5]
+                    tabla[j][i - 1] = str(aux * 3.28084)[:5]
+            else:
+                tabla[j][i] = " "
+                if colInicial == 4:
+                    tabla[j][i - 1] = " "
+            if col < colInicial + 8:
+                col += 2
+            else:
+                col = colInicial
+                row += 1
+
+
+# --- FUNCIÓN QUE REPRODUCE "nuevoMes", "to_string" Y "formato_tabla" DEL PROGRAMA ORIGINAL ---
+# Recibe cinco parámetros:
+# 1. valores -> registros del .LIS sin el primer ni el último día, ya sin el BMI.
+# 2. mes, year -> mes y año de la tabla.
+# 3. nombre, meridiano -> nombre y meridiano de la estación.
+# Regresa el texto de la página del mes.
+def texto_original(valores, mes, year, nombre, meridiano):
+    tabla = [[" "] * 12 for j in range(55)]
+    diaLimite = DIAS_ORIGINAL[mes] + (1 if mes == 2 and calendar.isleap(year) else 0)
+    k = 0
+    for i in range(0, 9, 4):
+        for j in range(0, 50, 5):
+            k += 1
+            tabla[j][i] = k
+            if k == diaLimite:
+                break
+    if diaLimite == 31:
+        tabla[50][8] = diaLimite
+    datos_original(tabla, valores, mes, year)
+
+    texto = pd.DataFrame(tabla, columns = COLUMNAS, dtype = object).to_string(index = False, col_space = 6)
+    lineaMeridiano = "\nHORA DEL MERIDIANO {:03d}° W.".format(int(meridiano))
+
+    texto = texto.replace("\n   ", "\n")
+    texto = texto.replace("METROS\n", "METROS\n\n")
+    texto = texto.replace("   ", "", 1)
+    # "cambiar_coincidencia": reemplaza el salto de línea número 52 por el de la "HORA DEL MERIDIANO".
+    encontrar = -1
+    for n in range(52):
+        encontrar = texto.find("\n", encontrar + 1)
+    texto = texto[:encontrar] + lineaMeridiano + texto[encontrar + 1:]
+    texto = texto.replace("W." + (" " * len(lineaMeridiano)), "W. ", 1)
+    texto = "\n" + texto
+
+    numCaracteres = len(texto.split("\n")[1])
+    fecha = dictMeses[mes][0] + " " + str(year)
+    relleno = " " * int((numCaracteres - len("ESTACION" + nombre + fecha)) / 2)
+    return "\n\n\n" + "ESTACION" + relleno + nombre + relleno + fecha + "\n" + texto
+
+
+def test_year_no_bisiesto_igual_al_original(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2025)[0]
+    resultado = generar_tablas(archivo, 2025, formatos = (), directorioDatos = str(tmp_path))
+    estacion = resultado.estacion
+
+    datos = leer_lis(archivo)
+    valores = np.column_stack([datos.estacion, datos.fecha, datos.hl,
+                               np.stack([datos.tiempos, datos.alturas - estacion.bmi], axis = 2).reshape(-1, 10)])[1:]
+
+    for mes in range(1, 13):
+        esperado = texto_original(valores, mes, 2025, estacion.nombre, estacion.meridiano)
+        obtenido = texto_mes(resultado.tablas[(2025, mes)], estacion.nombre, estacion.meridiano, mes, 2025,
+                             espaciar = False)
+        assert obtenido == esperado, dictMeses[mes][0]
+
+
+def test_year_bisiesto_cada_evento_en_su_dia(tmp_path):
+    archivo = generar_datos(str(tmp_path), estaciones = 1, years = 1, inicio = 2024)[0]
+    resultado = generar_tablas(archivo, 2024, formatos = (), directorioDatos = str(tmp_path))
+
+    # Registros de 2024: sin el 31 de diciembre anterior ni el 1 de enero siguiente. La columna HL...
+    # de los archivos sintéticos trae el mes de cada registro.
+    datos = leer_lis(archivo)
+    for mes in range(1, 13):
+        delMes = np.flatnonzero(datos.hl[1:-1] == mes) + 1
+        assert len(delMes) == calendar.monthrange(2024, mes)[1]
+
+        conDato = datos.tiempos[delMes] != 9999
+        diasEsperados = np.repeat(datos.fecha[delMes], conDato.sum(axis = 1))
+        horasEsperadas = ["{:04d}".format(int(hora)) for hora in datos.tiempos[delMes][conDato]]
+
+        dias, horas, pies, metros = eventos_tabla(resultado.tablas[(2024, mes)])
+        assert dias.tolist() == diasEsperados.tolist(), dictMeses[mes][0]
+        assert horas.tolist() == horasEsperadas, dictMeses[mes][0]